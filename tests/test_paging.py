@@ -0,0 +1,58 @@
+"""Paging must not stop early when a full page contains malformed rows."""
+
+import httpx
+
+from tracker.api import DataClient, GammaClient
+
+
+def _mock_client(client, handler):
+    """Point an API client at an in-process handler instead of the network."""
+    client.client.close()
+    client.client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _paged(rows, request):
+    """Return the slice of rows addressed by the request's limit/offset."""
+    offset = int(request.url.params.get("offset", 0))
+    limit = int(request.url.params.get("limit", 100))
+    return httpx.Response(200, json=rows[offset:offset + limit])
+
+
+def test_wallet_trades_page_past_malformed_row():
+    rows = [
+        {
+            "proxyWallet": "0xabc",
+            "conditionId": "0xcond",
+            "side": "BUY",
+            "size": 10,
+            "price": 0.5,
+            "timestamp": 1_700_000_000 - i,
+        }
+        for i in range(1500)
+    ]
+    rows[10] = {"timestamp": "not a number", "side": "BUY"}
+
+    with _mock_client(DataClient(), lambda request: _paged(rows, request)) as data:
+        trades = list(data.iter_wallet_trades("0xabc", limit=2000))
+
+    assert len(trades) == 1499
+
+
+def test_high_volume_markets_page_past_malformed_market():
+    markets = [
+        {
+            "conditionId": f"0xcond{i}",
+            "question": f"Market {i}?",
+            "volume24hr": 100_000 - i,
+        }
+        for i in range(30)
+    ]
+    markets[3] = {"conditionId": "0xbad", "volume24hr": "lots"}
+
+    with _mock_client(GammaClient(), lambda request: _paged(markets, request)) as gamma:
+        found = gamma.get_high_volume_markets(min_volume_24h=0, limit=10)
+
+    assert len(found) == 10
@@ -2,5 +2,7 @@
 
 from .gamma import GammaClient
 from .data import DataClient
+from .cache import ResponseCache
+from .fetcher import TradeFetcher
 
-__all__ = ["GammaClient", "DataClient"]
+__all__ = ["GammaClient", "DataClient", "ResponseCache", "TradeFetcher"]
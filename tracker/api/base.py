@@ -0,0 +1,176 @@
+"""Shared HTTP plumbing for Polymarket API clients."""
+
+import random
+import threading
+import time
+from concurrent.futures import Future
+from importlib.util import find_spec
+from typing import Any, Optional
+
+import httpx
+import orjson
+
+from .cache import ResponseCache
+
+# Keep sockets alive between scans so repeated requests skip the TLS handshake
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Connection-level failures are retried by the transport itself
+CONNECT_RETRIES = 3
+
+# Statuses that mean "slow down / try again" rather than a bad request
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 4
+RETRY_BACKOFF = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled or failed response.
+
+    Honors a numeric Retry-After header, otherwise backs off exponentially
+    with jitter so concurrent callers don't retry in lockstep.
+
+    Args:
+        response: The response that triggered the retry
+        attempt: Zero-based retry number
+
+    Returns:
+        Delay in seconds, capped at RETRY_MAX_DELAY
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    delay = RETRY_BACKOFF * 2 ** attempt
+    return min(delay + random.uniform(0, delay), RETRY_MAX_DELAY)
+
+
+def _warn_retry(response: httpx.Response, delay: float) -> None:
+    """Tell the user a request is being throttled and will be retried."""
+    from ..utils import console
+
+    console.print(
+        f"[yellow]{response.request.url.host} returned {response.status_code}, "
+        f"retrying in {delay:.1f}s[/]"
+    )
+
+
+class BaseClient:
+    """Base class for Polymarket API clients with a TTL response cache."""
+
+    base_url: str = ""
+    default_ttl: float = 60.0
+
+    def __init__(self, timeout: float = 30.0, cache: Optional[ResponseCache] = None):
+        """Initialize the client.
+
+        Args:
+            timeout: Request timeout in seconds
+            cache: Response cache (a private one is created if omitted)
+        """
+        self.timeout = timeout
+        self.cache = cache if cache is not None else ResponseCache()
+        # Requests currently on the wire, so concurrent identical GETs share one
+        self._in_flight: dict[tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                retries=CONNECT_RETRIES, limits=POOL_LIMITS, http2=HTTP2_AVAILABLE
+            ),
+        )
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self.cache.clear()
+
+    def _get_json(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        ttl: Optional[float] = None,
+        force_refresh: bool = False,
+    ) -> Any:
+        """GET a JSON endpoint, serving repeated requests from the cache.
+
+        Args:
+            path: Endpoint path relative to base_url
+            params: Query parameters
+            ttl: Seconds to cache the response (defaults to default_ttl)
+            force_refresh: Skip the cache lookup and refetch
+
+        Returns:
+            Decoded JSON body
+        """
+        return orjson.loads(self._get_bytes(path, params, ttl, force_refresh))
+
+    def _get_bytes(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        ttl: Optional[float] = None,
+        force_refresh: bool = False,
+    ) -> bytes:
+        """GET an endpoint and return the raw body, using the cache.
+
+        Lets callers with a typed decoder skip the generic JSON parse.
+        Arguments are the same as for _get_json. If another thread is already
+        fetching the same request, this waits for its result instead of
+        sending a duplicate. Throttled and gateway-error responses are
+        retried with backoff before raising.
+        """
+        key = self._cache_key(path, params)
+        if not force_refresh:
+            body = self.cache.get(key)
+            if body is not None:
+                return body
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                response = self.client.get(path, params=params)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                delay = _retry_delay(response, attempt)
+                _warn_retry(response, delay)
+                time.sleep(delay)
+            response.raise_for_status()
+            body = response.content
+            self.cache.set(key, body, self.default_ttl if ttl is None else ttl)
+            future.set_result(body)
+            return body
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[dict]) -> tuple:
+        """Build a hashable cache key from the path and query parameters."""
+        return (path, tuple(sorted(params.items())) if params else ())
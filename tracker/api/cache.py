@@ -0,0 +1,84 @@
+"""In-memory TTL cache for API responses."""
+
+import threading
+import time
+from typing import Hashable, Optional
+
+
+class ResponseCache:
+    """Thread-safe TTL cache mapping request keys to raw response bodies.
+
+    Bounded both by entry count and by the total size of the cached bodies.
+    Expired entries are swept on insert, so a long-lived client (e.g. across
+    watch ticks) doesn't hold on to bodies nobody asks for again.
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: int = 128 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Max entries kept before the oldest are evicted
+            maxbytes: Max total body bytes kept before the oldest are evicted
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._entries: dict[Hashable, tuple[float, bytes]] = {}
+        self._nbytes = 0
+        # Earliest expiry among cached entries, so sweeps only run when due
+        self._next_expiry = float("inf")
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            return body
+
+    def set(self, key: Hashable, body: bytes, ttl: float) -> None:
+        """Store body under key for ttl seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._remove(key)
+            if now >= self._next_expiry:
+                self._sweep(now)
+            if len(body) > self.maxbytes:
+                return
+
+            expires_at = now + ttl
+            self._entries[key] = (expires_at, body)
+            self._nbytes += len(body)
+            self._next_expiry = min(self._next_expiry, expires_at)
+            while len(self._entries) > self.maxsize or self._nbytes > self.maxbytes:
+                # Dicts keep insertion order, so the first key is the oldest
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._next_expiry = float("inf")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop key if present. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= len(entry[1])
+
+    def _sweep(self, now: float) -> None:
+        """Drop every expired entry. Caller must hold the lock."""
+        expired = [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self._next_expiry = min(
+            (expires_at for expires_at, _ in self._entries.values()), default=float("inf")
+        )
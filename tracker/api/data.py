@@ -1,28 +1,88 @@
 """Data API client for fetching trades and positions."""
 
-import httpx
+import asyncio
 from datetime import datetime
-from typing import Optional
+from itertools import chain, islice
+from operator import attrgetter
+from typing import AsyncIterator, Iterable, Iterator, Optional
 
-from ..models import Trade, Side
+import msgspec
+import numpy as np
 
-BASE_URL = "https://data-api.polymarket.com"
+try:
+    # Faster event loop where available (Linux/macOS); optional
+    from uvloop import run as run_async
+except ImportError:
+    from asyncio import run as run_async
 
+from ..models import SIDE_BITS, Trade, Side
+from .base import BaseClient
+from .cache import ResponseCache
 
-class DataClient:
-    """Client for Polymarket Data API."""
+BASE_URL = "https://data-api.polymarket.com"
 
-    def __init__(self, timeout: float = 30.0):
-        self.client = httpx.Client(base_url=BASE_URL, timeout=timeout)
+class _RawTrade(msgspec.Struct):
+    """The /trades row fields we use; other keys are skipped while decoding."""
+
+    timestamp: float
+    transactionHash: str = ""
+    proxyWallet: Optional[str] = None
+    user: str = ""
+    conditionId: str = ""
+    slug: str = ""
+    title: str = ""
+    side: str = "BUY"
+    outcome: str = ""
+    outcomeIndex: int = 0
+    size: float = 0.0
+    price: float = 0.0
+
+
+# Plain dict lookup instead of the Enum value search done by Side(...)
+_SIDE_MAP = {s.value: s for s in Side}
+
+# Columns get_trades_arrays can build, in the order returned by default
+TRADE_COLUMNS = (
+    "market_question", "side", "outcome", "size", "price", "usd_value", "timestamp"
+)
+# Text columns, built as object arrays
+OBJECT_COLUMNS = frozenset({"market_question", "side", "outcome"})
+# /trades row field behind each column (usd_value is derived)
+_ROW_COLUMN_FIELDS = {
+    "market_question": "title",
+    "side": "side",
+    "outcome": "outcome",
+    "size": "size",
+    "price": "price",
+    "timestamp": "timestamp",
+}
+
+# Lax mode accepts numbers sent as strings, as float()/int() did before
+_TRADE_ROWS_DECODER = msgspec.json.Decoder(list[_RawTrade], strict=False)
+
+
+class DataClient(BaseClient):
+    """Client for Polymarket Data API."""
 
-    def close(self):
-        self.client.close()
+    base_url = BASE_URL
+    # Trades roll over quickly, so only dedupe requests within a scan
+    default_ttl = 60.0
 
-    def __enter__(self):
-        return self
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_concurrency: int = 8,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """Initialize the client.
 
-    def __exit__(self, *args):
-        self.close()
+        Args:
+            timeout: Request timeout in seconds
+            max_concurrency: Max in-flight requests for concurrent fetches
+            cache: Response cache (a private one is created if omitted)
+        """
+        super().__init__(timeout=timeout, cache=cache)
+        self.max_concurrency = max_concurrency
 
     def get_trades(
         self,
@@ -32,6 +92,7 @@ class DataClient:
         min_amount: Optional[float] = None,
         limit: int = 1000,
         offset: int = 0,
+        force_refresh: bool = False,
     ) -> list[Trade]:
         """Fetch trades from Data API.
 
@@ -42,38 +103,89 @@ class DataClient:
             min_amount: Minimum trade size in USD
             limit: Max results (max 10000)
             offset: Pagination offset
+            force_refresh: Bypass the response cache
 
         Returns:
             List of Trade objects
         """
-        params = {"limit": min(limit, 10000), "offset": offset}
+        path, params = self._trades_request(
+            market, user, side, min_amount, limit, offset
+        )
+        rows, _ = self._get_trades_page(path, params, force_refresh=force_refresh)
+        return list(self._iter_parsed_trades(rows, min_usd=min_amount))
 
-        if market:
-            params["market"] = market
-        if user:
-            params["user"] = user
-        if side:
-            params["side"] = side
-        if min_amount:
-            params["filterType"] = "CASH"
-            params["filterAmount"] = min_amount
+    def iter_trades(
+        self,
+        market: Optional[str] = None,
+        user: Optional[str] = None,
+        side: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Trade]:
+        """Iterate over all matching trades, newest first, one page at a time.
+
+        Pages are only requested as the iterator is consumed, so wrapping it
+        in itertools.islice never fetches more than needed. The /trades
+        endpoint has no keyset cursor, so pages are addressed by offset.
+
+        Args:
+            market: Condition ID to filter by
+            user: Wallet address to filter by
+            side: BUY or SELL
+            min_amount: Minimum trade size in USD
+            page_size: Trades requested per page (max 10000)
+
+        Yields:
+            Trade objects
+        """
+        rows = self._iter_trade_rows(market, user, side, min_amount, page_size)
+        return self._iter_parsed_trades(rows, min_usd=min_amount)
+
+    def get_trades_arrays(
+        self,
+        market: Optional[str] = None,
+        user: Optional[str] = None,
+        limit: int = 1000,
+        columns: Optional[Iterable[str]] = None,
+    ) -> dict[str, np.ndarray]:
+        """Fetch trades as column arrays instead of Trade objects.
 
-        response = self.client.get("/trades", params=params)
-        response.raise_for_status()
-        data = response.json()
+        Suited to aggregations over many trades: reductions run over
+        contiguous arrays rather than attribute reads on each Trade.
 
-        trades = []
-        for item in data:
-            trade = self._parse_trade(item)
-            if trade:
-                trades.append(trade)
+        Args:
+            market: Condition ID to filter by
+            user: Wallet address to filter by
+            limit: Max results
+            columns: Names of the columns to build (default: all of
+                TRADE_COLUMNS)
 
-        return trades
+        Returns:
+            Dict of equal-length arrays, newest trade first: "market_question",
+            "side" and "outcome" (object), "size", "price", "usd_value" and
+            "timestamp" (float64, epoch seconds), limited to columns
+        """
+        rows = self._iter_trade_rows(market, user, page_size=min(limit, 10000))
+        # Same row checks as the Trade parser, so both paths keep the same rows
+        rows = [row for row, _, _ in self._iter_valid_rows(islice(rows, limit))]
+        count = len(rows)
+
+        arrays = {}
+        for name in TRADE_COLUMNS if columns is None else columns:
+            if name == "usd_value":
+                values = (r.size * r.price for r in rows)
+            else:
+                values = map(attrgetter(_ROW_COLUMN_FIELDS[name]), rows)
+            if name in OBJECT_COLUMNS:
+                arrays[name] = np.array(list(values), dtype=object)
+            else:
+                arrays[name] = np.fromiter(values, dtype=np.float64, count=count)
+        return arrays
 
     def get_trades_for_markets(
         self, market_ids: list[str], limit_per_market: int = 500
     ) -> list[Trade]:
-        """Fetch trades for multiple markets.
+        """Fetch trades for multiple markets concurrently.
 
         Args:
             market_ids: List of condition IDs
@@ -82,11 +194,87 @@ class DataClient:
         Returns:
             List of trades across all markets
         """
-        all_trades = []
-        for market_id in market_ids:
-            trades = self.get_trades(market=market_id, limit=limit_per_market)
-            all_trades.extend(trades)
-        return all_trades
+        by_market = self.get_trades_by_market(market_ids, limit_per_market)
+        return list(chain.from_iterable(by_market.values()))
+
+    def get_trades_by_market(
+        self, market_ids: list[str], limit_per_market: int = 500
+    ) -> dict[str, list[Trade]]:
+        """Fetch trades for multiple markets concurrently, grouped by market.
+
+        Blocking wrapper around get_trades_by_market_async for sync callers.
+
+        Args:
+            market_ids: List of condition IDs
+            limit_per_market: Max trades per market
+
+        Returns:
+            Dict mapping condition ID to that market's trades
+        """
+        return run_async(
+            self.get_trades_by_market_async(market_ids, limit_per_market)
+        )
+
+    async def get_trades_by_market_async(
+        self, market_ids: list[str], limit_per_market: int = 500
+    ) -> dict[str, list[Trade]]:
+        """Fetch trades for multiple markets concurrently, grouped by market.
+
+        Each request runs on the pooled sync client in a worker thread (see
+        iter_trades_by_market_async), bounded by max_concurrency to stay
+        within Polymarket rate limits.
+
+        Args:
+            market_ids: List of condition IDs
+            limit_per_market: Max trades per market
+
+        Returns:
+            Dict mapping condition ID to that market's trades, in
+            market_ids order
+        """
+        market_ids = list(dict.fromkeys(market_ids))
+        pages = {}
+        async for market_id, trades in self.iter_trades_by_market_async(
+            market_ids, limit_per_market
+        ):
+            pages[market_id] = trades
+        return {market_id: pages[market_id] for market_id in market_ids}
+
+    async def iter_trades_by_market_async(
+        self, market_ids: list[str], limit_per_market: int = 500
+    ) -> AsyncIterator[tuple[str, list[Trade]]]:
+        """Fetch trades for multiple markets concurrently, yielding as they land.
+
+        Lets callers start work on a market while the rest are still being
+        fetched. Each request runs get_trades in a worker thread, so it goes
+        through the client's pooled connections, response cache and
+        single-flight dedupe; at most max_concurrency run at once.
+
+        Args:
+            market_ids: List of condition IDs
+            limit_per_market: Max trades per market
+
+        Yields:
+            (condition ID, trades) pairs in completion order
+        """
+        market_ids = list(dict.fromkeys(market_ids))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(market_id: str) -> tuple[str, list[Trade]]:
+            async with semaphore:
+                trades = await asyncio.to_thread(
+                    self.get_trades, market=market_id, limit=limit_per_market
+                )
+            return market_id, trades
+
+        tasks = [asyncio.create_task(fetch(m)) for m in market_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Don't start queued requests if the consumer stops early
+            for task in tasks:
+                task.cancel()
 
     def get_large_trades(
         self, market: str, min_usd: float = 1000, limit: int = 500
@@ -115,7 +303,22 @@ class DataClient:
         Returns:
             List of trades by this wallet
         """
-        return self.get_trades(user=wallet, limit=limit)
+        return list(self.iter_wallet_trades(wallet, limit=limit))
+
+    def iter_wallet_trades(
+        self, wallet: str, limit: int = 1000
+    ) -> Iterator[Trade]:
+        """Stream trades for a specific wallet, newest first.
+
+        Args:
+            wallet: Wallet address (0x prefixed)
+            limit: Max results
+
+        Yields:
+            Trades by this wallet
+        """
+        trades = self.iter_trades(user=wallet, page_size=min(limit, 1000))
+        return islice(trades, limit)
 
     def get_holders(
         self, market: str, limit: int = 100
@@ -130,9 +333,7 @@ class DataClient:
             List of holder data with wallet and position info
         """
         params = {"market": market, "limit": limit}
-        response = self.client.get("/holders", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_json("/holders", params)
 
     def get_positions(
         self,
@@ -157,34 +358,169 @@ class DataClient:
             params["user"] = user
         if market:
             params["market"] = market
-        if min_size:
+        if min_size is not None:
             params["sizeThreshold"] = min_size
 
-        response = self.client.get("/positions", params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_json("/positions", params)
+
+    def _trades_request(
+        self,
+        market: Optional[str],
+        user: Optional[str],
+        side: Optional[str],
+        min_amount: Optional[float],
+        limit: int,
+        offset: int,
+    ) -> tuple[str, Optional[dict]]:
+        """Build the path and query parameters for a /trades request.
+
+        The common single-market and single-wallet lookups are formatted
+        straight into the URL, skipping httpx's per-call params encoding.
+        Condition IDs and wallet addresses are hex, so they need no escaping.
+
+        Returns:
+            Tuple of (path, params); params is None when the query is
+            already part of the path
+        """
+        limit = min(limit, 10000)
+
+        if side is None and min_amount is None:
+            if market and not user and market.isalnum():
+                return f"/trades?limit={limit}&offset={offset}&market={market}", None
+            if user and not market and user.isalnum():
+                return f"/trades?limit={limit}&offset={offset}&user={user}", None
+
+        params = {"limit": limit, "offset": offset}
+
+        if market:
+            params["market"] = market
+        if user:
+            params["user"] = user
+        if side:
+            params["side"] = side
+        if min_amount is not None:
+            params["filterType"] = "CASH"
+            params["filterAmount"] = min_amount
+
+        return "/trades", params
+
+    def _iter_trade_rows(
+        self,
+        market: Optional[str] = None,
+        user: Optional[str] = None,
+        side: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        page_size: int = 1000,
+    ) -> Iterator[_RawTrade]:
+        """Yield raw /trades rows across pages, fetching each page lazily."""
+        page_size = min(page_size, 10000)
+        offset = 0
+        while True:
+            path, params = self._trades_request(
+                market, user, side, min_amount, page_size, offset
+            )
+            rows, row_count = self._get_trades_page(path, params)
+            yield from rows
+
+            # A short page means the server has nothing left. Judge by the
+            # raw row count, so dropping a malformed row doesn't end paging.
+            if row_count < page_size:
+                return
+            offset += page_size
+
+    def _get_trades_page(
+        self, path: str, params: Optional[dict], force_refresh: bool = False
+    ) -> tuple[list[_RawTrade], int]:
+        """Fetch one page of raw /trades rows.
 
-    def _parse_trade(self, data: dict) -> Optional[Trade]:
-        """Parse API response into Trade model."""
+        Returns:
+            Tuple of (decoded rows, number of rows the server sent)
+        """
+        body = self._get_bytes(path, params, force_refresh=force_refresh)
+        return self._decode_trade_rows(body)
+
+    def _decode_trade_rows(self, body: bytes) -> tuple[list[_RawTrade], int]:
+        """Decode a /trades body straight into typed rows.
+
+        The whole page is decoded in one pass; if any row is malformed, rows
+        are converted one by one so only the bad ones are dropped.
+
+        Returns:
+            Tuple of (decoded rows, number of rows in the body including
+            malformed ones)
+        """
         try:
-            timestamp = datetime.fromtimestamp(data["timestamp"])
-            size = float(data.get("size", 0))
-            price = float(data.get("price", 0))
-            usd_value = size * price
-
-            return Trade(
-                transaction_hash=data.get("transactionHash", ""),
-                wallet=data.get("proxyWallet", data.get("user", "")),
-                market_id=data.get("conditionId", ""),
-                market_slug=data.get("slug", ""),
-                market_question=data.get("title", ""),
-                side=Side(data.get("side", "BUY")),
-                outcome=data.get("outcome", ""),
-                outcome_index=int(data.get("outcomeIndex", 0)),
-                size=size,
-                price=price,
-                usd_value=usd_value,
+            rows = _TRADE_ROWS_DECODER.decode(body)
+            return rows, len(rows)
+        except msgspec.ValidationError:
+            pass
+
+        items = msgspec.json.decode(body)
+        rows = []
+        for item in items:
+            try:
+                rows.append(msgspec.convert(item, _RawTrade, strict=False))
+            except msgspec.ValidationError:
+                continue
+        return rows, len(items)
+
+    def _iter_valid_rows(
+        self, rows: Iterable[_RawTrade], min_usd: Optional[float] = None
+    ) -> Iterator[tuple[_RawTrade, Side, datetime]]:
+        """Lazily filter raw /trades rows, skipping malformed ones.
+
+        Args:
+            rows: Decoded /trades rows
+            min_usd: Drop rows below this USD value
+                (the server-side amount filter is not always honored)
+
+        Yields:
+            (row, parsed side, parsed local timestamp) tuples
+        """
+        # Bind lookups to locals once rather than resolving them per row
+        side_map = _SIDE_MAP
+        fromtimestamp = datetime.fromtimestamp
+
+        for row in rows:
+            if min_usd is not None and row.size * row.price < min_usd:
+                continue
+            side = side_map.get(row.side)
+            if side is None:
+                continue
+            try:
+                timestamp = fromtimestamp(row.timestamp)
+            except (ValueError, OverflowError, OSError):
+                continue
+            yield row, side, timestamp
+
+    def _iter_parsed_trades(
+        self, rows: Iterable[_RawTrade], min_usd: Optional[float] = None
+    ) -> Iterator[Trade]:
+        """Lazily parse raw /trades rows, skipping malformed ones.
+
+        Args:
+            rows: Decoded /trades rows
+            min_usd: Drop rows below this USD value before building a Trade
+
+        Yields:
+            Trade objects
+        """
+        side_bits = SIDE_BITS
+
+        for row, side, timestamp in self._iter_valid_rows(rows, min_usd):
+            yield Trade(
+                transaction_hash=row.transactionHash,
+                wallet=row.proxyWallet if row.proxyWallet is not None else row.user,
+                market_id=row.conditionId,
+                market_slug=row.slug,
+                market_question=row.title,
+                side=side,
+                side_bit=side_bits[side],
+                outcome=row.outcome,
+                outcome_index=row.outcomeIndex,
+                size=row.size,
+                price=row.price,
+                usd_value=row.size * row.price,
                 timestamp=timestamp,
+                epoch=row.timestamp,
             )
-        except Exception:
-            return None
@@ -0,0 +1,136 @@
+"""Per-scan trade store shared by detectors."""
+
+from operator import attrgetter
+from typing import AsyncIterator, Iterable, Optional
+
+import numpy as np
+
+from ..models import Trade
+from .data import OBJECT_COLUMNS, TRADE_COLUMNS, DataClient
+
+# Trade attribute behind each get_trades_arrays column
+_TRADE_COLUMN_GETTERS = {
+    "market_question": attrgetter("market_question"),
+    "side": attrgetter("side.value"),
+    "outcome": attrgetter("outcome"),
+    "size": attrgetter("size"),
+    "price": attrgetter("price"),
+    "usd_value": attrgetter("usd_value"),
+    "timestamp": attrgetter("epoch"),
+}
+
+
+class TradeFetcher:
+    """Fetches each market's trades once per scan and shares them.
+
+    Stands in for DataClient in the detectors: every detector asks for the
+    same markets with different limits, so the largest window fetched for a
+    market serves all smaller requests until clear() is called.
+    """
+
+    def __init__(self, data_client: DataClient):
+        """Initialize the fetcher.
+
+        Args:
+            data_client: Client used for the underlying requests
+        """
+        self.data = data_client
+        # condition ID -> (limit it was fetched with, trades newest first)
+        self._trades: dict[str, tuple[int, list[Trade]]] = {}
+
+    def clear(self) -> None:
+        """Forget all fetched trades, e.g. at the start of a new scan."""
+        self._trades.clear()
+
+    def get_trades(self, market: str, limit: int = 100) -> list[Trade]:
+        """Get a market's most recent trades, fetching them if not held.
+
+        Args:
+            market: Condition ID
+            limit: Max trades to return
+
+        Returns:
+            List of Trade objects, newest first
+        """
+        trades = self._lookup(market, limit)
+        if trades is None:
+            trades = self.data.get_trades(market=market, limit=limit)
+            self._trades[market] = (limit, trades)
+        return trades
+
+    def get_trades_arrays(
+        self,
+        market: str,
+        limit: int = 1000,
+        columns: Optional[Iterable[str]] = None,
+    ) -> dict[str, np.ndarray]:
+        """Get a market's trades as column arrays, like DataClient.get_trades_arrays.
+
+        Columns are built from the held trades, so they line up with what
+        get_trades returns for the same market and limit. Only the requested
+        columns are built.
+
+        Args:
+            market: Condition ID
+            limit: Max trades
+            columns: Names of the columns to build (default: all of
+                TRADE_COLUMNS)
+
+        Returns:
+            Dict of equal-length arrays, newest trade first (same keys as
+            DataClient.get_trades_arrays)
+        """
+        trades = self.get_trades(market, limit)
+        count = len(trades)
+        arrays = {}
+        for name in TRADE_COLUMNS if columns is None else columns:
+            values = map(_TRADE_COLUMN_GETTERS[name], trades)
+            if name in OBJECT_COLUMNS:
+                arrays[name] = np.array(list(values), dtype=object)
+            else:
+                arrays[name] = np.fromiter(values, dtype=np.float64, count=count)
+        return arrays
+
+    def get_trades_by_market(
+        self, market_ids: list[str], limit_per_market: int = 500
+    ) -> dict[str, list[Trade]]:
+        """Get trades for several markets, concurrently fetching any not held.
+
+        Args:
+            market_ids: List of condition IDs
+            limit_per_market: Max trades per market
+
+        Returns:
+            Dict mapping condition ID to that market's trades
+        """
+        missing = [m for m in market_ids if self._lookup(m, limit_per_market) is None]
+        if missing:
+            fetched = self.data.get_trades_by_market(missing, limit_per_market)
+            for market_id, trades in fetched.items():
+                self._trades[market_id] = (limit_per_market, trades)
+        return {m: self._lookup(m, limit_per_market) for m in market_ids}
+
+    async def iter_trades_by_market_async(
+        self, market_ids: list[str], limit_per_market: int = 500
+    ) -> AsyncIterator[tuple[str, list[Trade]]]:
+        """Fetch trades for several markets, keeping and yielding them as they land.
+
+        Args:
+            market_ids: List of condition IDs
+            limit_per_market: Max trades per market
+
+        Yields:
+            (condition ID, trades) pairs in completion order
+        """
+        async for market_id, trades in self.data.iter_trades_by_market_async(
+            market_ids, limit_per_market
+        ):
+            self._trades[market_id] = (limit_per_market, trades)
+            yield market_id, trades
+
+    def _lookup(self, market: str, limit: int) -> Optional[list[Trade]]:
+        """Return held trades for a market if they cover limit, else None."""
+        held = self._trades.get(market)
+        if held is None or held[0] < limit:
+            return None
+        return held[1][:limit]
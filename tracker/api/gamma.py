@@ -1,28 +1,50 @@
 """Gamma API client for fetching market data."""
 
 import httpx
-from datetime import datetime
-from typing import Optional
+import msgspec
+import orjson
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
 
 from ..models import Market
+from .base import BaseClient
 
 BASE_URL = "https://gamma-api.polymarket.com"
 
 
-class GammaClient:
-    """Client for Polymarket Gamma API."""
+class _RawMarket(msgspec.Struct):
+    """The /markets fields we use; other keys are skipped while decoding."""
+
+    conditionId: Optional[str] = None
+    id: str = ""
+    question: str = ""
+    slug: str = ""
+    endDate: Optional[str] = None
+    volume: Optional[float] = None
+    volume24hr: Optional[float] = None
+    liquidity: Optional[float] = None
+    # Gamma sends these as JSON-encoded strings, but tolerate real lists
+    outcomes: Union[str, list, None] = None
+    outcomePrices: Union[str, list, None] = None
+    active: bool = True
 
-    def __init__(self, timeout: float = 30.0):
-        self.client = httpx.Client(base_url=BASE_URL, timeout=timeout)
 
-    def close(self):
-        self.client.close()
+# Lax mode accepts numbers sent as strings, as float() did before
+_MARKET_DECODER = msgspec.json.Decoder(_RawMarket, strict=False)
+_MARKETS_DECODER = msgspec.json.Decoder(list[_RawMarket], strict=False)
 
-    def __enter__(self):
-        return self
+# Validates a whole page of markets in one pydantic-core call
+_MARKETS_ADAPTER = TypeAdapter(list[Market])
+
+
+class GammaClient(BaseClient):
+    """Client for Polymarket Gamma API."""
 
-    def __exit__(self, *args):
-        self.close()
+    base_url = BASE_URL
+    # Market metadata changes slowly relative to trades
+    default_ttl = 300.0
 
     def get_markets(
         self,
@@ -32,6 +54,9 @@ class GammaClient:
         offset: int = 0,
         order: str = "volume24hr",
         ascending: bool = False,
+        end_date_min: Optional[datetime] = None,
+        end_date_max: Optional[datetime] = None,
+        force_refresh: bool = False,
     ) -> list[Market]:
         """Fetch markets from Gamma API.
 
@@ -42,10 +67,36 @@ class GammaClient:
             offset: Pagination offset
             order: Sort field (volume24hr, volume, liquidity, endDate)
             ascending: Sort direction
+            end_date_min: Only markets ending at or after this time (naive UTC)
+            end_date_max: Only markets ending at or before this time (naive UTC)
+            force_refresh: Bypass the response cache
 
         Returns:
             List of Market objects
         """
+        markets, _ = self._get_markets_page(
+            active, closed, limit, offset, order, ascending,
+            end_date_min, end_date_max, force_refresh,
+        )
+        return markets
+
+    def _get_markets_page(
+        self,
+        active: bool,
+        closed: bool,
+        limit: int,
+        offset: int,
+        order: str,
+        ascending: bool,
+        end_date_min: Optional[datetime],
+        end_date_max: Optional[datetime],
+        force_refresh: bool,
+    ) -> tuple[list[Market], int]:
+        """Fetch one page of markets; arguments are as for get_markets.
+
+        Returns:
+            Tuple of (parsed markets, number of rows the server sent)
+        """
         params = {
             "active": str(active).lower(),
             "closed": str(closed).lower(),
@@ -54,35 +105,34 @@ class GammaClient:
             "order": order,
             "ascending": str(ascending).lower(),
         }
+        if end_date_min is not None:
+            params["end_date_min"] = end_date_min.isoformat(timespec="seconds") + "Z"
+        if end_date_max is not None:
+            params["end_date_max"] = end_date_max.isoformat(timespec="seconds") + "Z"
 
-        response = self.client.get("/markets", params=params)
-        response.raise_for_status()
-        data = response.json()
-
-        markets = []
-        for item in data:
-            market = self._parse_market(item)
-            if market:
-                markets.append(market)
-
-        return markets
+        body = self._get_bytes("/markets", params, force_refresh=force_refresh)
+        rows, row_count = self._decode_markets(body)
+        return self._parse_markets(rows), row_count
 
     def get_market(self, condition_id: str) -> Optional[Market]:
         """Fetch a single market by condition ID."""
-        response = self.client.get(f"/markets/{condition_id}")
-        if response.status_code == 404:
+        try:
+            body = self._get_bytes(f"/markets/{condition_id}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        try:
+            return self._parse_market(_MARKET_DECODER.decode(body))
+        except msgspec.ValidationError:
             return None
-        response.raise_for_status()
-        return self._parse_market(response.json())
 
     def get_market_by_slug(self, slug: str) -> Optional[Market]:
         """Fetch a market by its slug."""
         params = {"slug": slug}
-        response = self.client.get("/markets", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if data:
-            return self._parse_market(data[0])
+        rows, _ = self._decode_markets(self._get_bytes("/markets", params))
+        if rows:
+            return self._parse_market(rows[0])
         return None
 
     def get_high_volume_markets(
@@ -97,10 +147,36 @@ class GammaClient:
         Returns:
             List of high-volume markets sorted by 24h volume
         """
-        markets = self.get_markets(
-            active=True, limit=limit, order="volume24hr", ascending=False
-        )
-        return [m for m in markets if m.volume_24h >= min_volume_24h]
+        # The API has no 24h-volume filter, but results are sorted by it, so
+        # page until we have enough or hit the first market below threshold
+        if limit <= 0:
+            return []
+        markets: list[Market] = []
+        offset = 0
+        while True:
+            page, row_count = self._get_markets_page(
+                active=True,
+                closed=False,
+                limit=limit,
+                offset=offset,
+                order="volume24hr",
+                ascending=False,
+                end_date_min=None,
+                end_date_max=None,
+                force_refresh=False,
+            )
+            for market in page:
+                if market.volume_24h < min_volume_24h:
+                    return markets
+                markets.append(market)
+                if len(markets) >= limit:
+                    return markets
+
+            # Judge the last page by the raw row count, so markets dropped as
+            # malformed don't end the scan early
+            if row_count < limit:
+                return markets
+            offset += limit
 
     def get_markets_closing_soon(
         self, hours: int = 24, limit: int = 50
@@ -114,12 +190,19 @@ class GammaClient:
         Returns:
             List of markets closing soon
         """
-        from datetime import timedelta
-
         now = datetime.utcnow()
         cutoff = now + timedelta(hours=hours)
 
-        markets = self.get_markets(active=True, limit=200, order="endDate", ascending=True)
+        # Let the server apply the date window so only matching rows come
+        # back. Keep the overfetch and the check below in case it doesn't.
+        markets = self.get_markets(
+            active=True,
+            limit=max(limit, 200),
+            order="endDate",
+            ascending=True,
+            end_date_min=now,
+            end_date_max=cutoff,
+        )
 
         closing_soon = []
         for m in markets:
@@ -130,50 +213,97 @@ class GammaClient:
 
         return closing_soon
 
-    def _parse_market(self, data: dict) -> Optional[Market]:
-        """Parse API response into Market model."""
+    def _decode_markets(self, body: bytes) -> tuple[list[_RawMarket], int]:
+        """Decode a /markets body straight into typed rows.
+
+        The whole page is decoded in one pass; if any row is malformed, rows
+        are converted one by one so only the bad ones are dropped.
+
+        Returns:
+            Tuple of (decoded rows, number of rows in the body including
+            malformed ones)
+        """
+        try:
+            rows = _MARKETS_DECODER.decode(body)
+            return rows, len(rows)
+        except msgspec.ValidationError:
+            pass
+
+        items = msgspec.json.decode(body)
+        rows = []
+        for item in items:
+            try:
+                rows.append(msgspec.convert(item, _RawMarket, strict=False))
+            except msgspec.ValidationError:
+                continue
+        return rows, len(items)
+
+    def _parse_markets(self, rows: list[_RawMarket]) -> list[Market]:
+        """Parse decoded /markets rows into Market models.
+
+        All rows are validated in one pass; if any fails, rows are validated
+        one by one so only the bad ones are dropped.
+        """
+        fields = [f for f in map(self._market_fields, rows) if f is not None]
+        try:
+            return _MARKETS_ADAPTER.validate_python(fields)
+        except ValidationError:
+            pass
+
+        markets = []
+        for f in fields:
+            try:
+                markets.append(Market.model_validate(f))
+            except ValidationError:
+                continue
+        return markets
+
+    def _parse_market(self, raw: _RawMarket) -> Optional[Market]:
+        """Parse a decoded /markets row into a Market model."""
+        markets = self._parse_markets([raw])
+        return markets[0] if markets else None
+
+    def _market_fields(self, raw: _RawMarket) -> Optional[dict]:
+        """Map a decoded /markets row to Market fields, or None if malformed."""
         try:
             end_date = None
-            if data.get("endDate"):
+            raw_end = raw.endDate
+            if raw_end:
                 try:
                     # Parse and convert to naive UTC datetime for consistency
-                    dt = datetime.fromisoformat(
-                        data["endDate"].replace("Z", "+00:00")
-                    )
-                    end_date = dt.replace(tzinfo=None)
+                    if raw_end.endswith("Z"):
+                        raw_end = raw_end[:-1] + "+00:00"
+                    end_date = datetime.fromisoformat(raw_end).replace(tzinfo=None)
                 except (ValueError, TypeError):
                     pass
 
             outcomes = []
             outcome_prices = []
-            if data.get("outcomes"):
-                raw_outcomes = data["outcomes"]
-                if isinstance(raw_outcomes, str):
-                    import json
-                    outcomes = json.loads(raw_outcomes)
+            if raw.outcomes:
+                if isinstance(raw.outcomes, str):
+                    outcomes = orjson.loads(raw.outcomes)
                 else:
-                    outcomes = raw_outcomes
-            if data.get("outcomePrices"):
-                raw_prices = data["outcomePrices"]
+                    outcomes = raw.outcomes
+            if raw.outcomePrices:
+                raw_prices = raw.outcomePrices
                 if isinstance(raw_prices, str):
-                    import json
-                    raw_prices = json.loads(raw_prices)
+                    raw_prices = orjson.loads(raw_prices)
                 try:
                     outcome_prices = [float(p) for p in raw_prices]
                 except (ValueError, TypeError):
                     outcome_prices = []
 
-            return Market(
-                condition_id=data.get("conditionId", data.get("id", "")),
-                question=data.get("question", ""),
-                slug=data.get("slug", ""),
-                end_date=end_date,
-                volume=float(data.get("volume", 0) or 0),
-                volume_24h=float(data.get("volume24hr", 0) or 0),
-                liquidity=float(data.get("liquidity", 0) or 0),
-                outcomes=outcomes,
-                outcome_prices=outcome_prices,
-                active=data.get("active", True),
-            )
+            return {
+                "condition_id": raw.conditionId if raw.conditionId is not None else raw.id,
+                "question": raw.question,
+                "slug": raw.slug,
+                "end_date": end_date,
+                "volume": raw.volume or 0.0,
+                "volume_24h": raw.volume24hr or 0.0,
+                "liquidity": raw.liquidity or 0.0,
+                "outcomes": outcomes,
+                "outcome_prices": outcome_prices,
+                "active": raw.active,
+            }
         except Exception:
             return None
@@ -1,29 +1,29 @@
-"""CLI entry point for Polymarket insider trading tracker."""
+"""CLI entry point for Polymarket insider trading tracker.
+
+Heavy dependencies (httpx, rich, numpy and the detectors) are imported
+inside the command functions so --help and --version start instantly.
+"""
 
 import argparse
 import sys
-import time
-from datetime import datetime
-
-from rich.console import Console
-from rich.live import Live
-from rich.spinner import Spinner
-from rich.text import Text
-
-from .api import GammaClient, DataClient
-from .detectors import LargeTradeDetector, VolumeAnomalyDetector, WalletClusterDetector
-from .utils import (
-    console,
-    print_alert,
-    print_alerts_summary,
-    print_market,
-    print_markets_table,
-    format_usd,
-    format_wallet,
-)
+from operator import attrgetter
 
 VERSION = "0.1.0"
 
+# Alert keys remembered by watch before the oldest are forgotten
+MAX_SEEN_ALERTS = 10_000
+
+# Largest per-market trade window any detector reads (VolumeAnomalyDetector)
+SCAN_TRADES_PER_MARKET = 5000
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts and intervals that can't go below zero."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create CLI argument parser."""
@@ -111,9 +111,9 @@ def create_parser() -> argparse.ArgumentParser:
     )
     watch_parser.add_argument(
         "--interval",
-        type=int,
+        type=_non_negative_int,
         default=15,
-        help="Minutes between scans (default: 15)",
+        help="Minutes between scans, 0 to scan back to back (default: 15)",
     )
     watch_parser.add_argument(
         "--min-volume",
@@ -125,8 +125,84 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def run_detectors(fetcher, detectors: dict, markets: list) -> dict[str, list]:
+    """Fetch each market's trades and run detectors over them as they arrive.
+
+    A single async producer fetches trades into the shared TradeFetcher and
+    fans each finished market out to one queue per detector. Per-market detectors
+    analyze a market in a worker thread as soon as it lands, so compute
+    overlaps the remaining fetches; cross-market detectors start once
+    everything is in.
+
+    Args:
+        fetcher: TradeFetcher the detectors read trades from
+        detectors: Mapping of label to detector
+        markets: Markets to scan
+
+    Returns:
+        Mapping of label to that detector's alerts, sorted by score
+    """
+    from .api.data import run_async
+
+    return run_async(_run_detectors_async(fetcher, detectors, markets))
+
+
+async def _run_detectors_async(fetcher, detectors: dict, markets: list) -> dict[str, list]:
+    """Async body of run_detectors."""
+    import asyncio
+    import heapq
+
+    positions: dict[str, list[int]] = {}
+    for i, market in enumerate(markets):
+        positions.setdefault(market.condition_id, []).append(i)
+
+    queues = {
+        label: asyncio.Queue()
+        for label, detector in detectors.items()
+        if not detector.cross_market
+    }
+    fetched = asyncio.Event()
+
+    async def produce() -> None:
+        async for market_id, _ in fetcher.iter_trades_by_market_async(
+            list(positions), limit_per_market=SCAN_TRADES_PER_MARKET
+        ):
+            for queue in queues.values():
+                queue.put_nowait(market_id)
+        for queue in queues.values():
+            queue.put_nowait(None)
+        fetched.set()
+
+    async def consume(label: str) -> list:
+        detector, queue = detectors[label], queues[label]
+        # Kept in market order so ties sort the same as a sequential scan
+        by_position: list[list] = [[] for _ in markets]
+        while (market_id := await queue.get()) is not None:
+            for i in positions[market_id]:
+                by_position[i] = await asyncio.to_thread(detector.scan, [markets[i]])
+        alerts = [alert for chunk in by_position for alert in chunk]
+        return heapq.nlargest(detector.top_n, alerts, key=attrgetter("score"))
+
+    async def scan_all(label: str) -> list:
+        await fetched.wait()
+        return await asyncio.to_thread(detectors[label].scan, markets)
+
+    labels = list(detectors)
+    _, results = await asyncio.gather(
+        produce(),
+        asyncio.gather(
+            *(consume(label) if label in queues else scan_all(label) for label in labels)
+        ),
+    )
+    return dict(zip(labels, results))
+
+
 def cmd_scan(args: argparse.Namespace) -> int:
     """Execute scan command."""
+    from .api import DataClient, GammaClient, TradeFetcher
+    from .detectors import LargeTradeDetector, VolumeAnomalyDetector, WalletClusterDetector
+    from .utils import console, print_alert, print_alerts_summary
+
     console.print(f"[bold]Scanning for suspicious activity...[/]\n")
 
     with GammaClient() as gamma, DataClient() as data:
@@ -142,33 +218,36 @@ def cmd_scan(args: argparse.Namespace) -> int:
 
         console.print(f"Found {len(markets)} markets to analyze\n")
 
+        # Filled by run_detectors as trades arrive and shared across detectors
+        fetcher = TradeFetcher(data)
+
         # Initialize detectors
-        large_trade_detector = LargeTradeDetector(gamma, data)
-        volume_detector = VolumeAnomalyDetector(gamma, data)
-        cluster_detector = WalletClusterDetector(gamma, data)
+        large_trade_detector = LargeTradeDetector(gamma, fetcher)
+        volume_detector = VolumeAnomalyDetector(gamma, fetcher)
+        cluster_detector = WalletClusterDetector(gamma, fetcher)
 
         all_alerts = []
 
         # Run detectors
-        with console.status("Analyzing large trades..."):
-            alerts = large_trade_detector.scan(markets)
-            all_alerts.extend(alerts)
-            console.print(f"  Large trades: {len(alerts)} alerts")
-
-        with console.status("Analyzing volume anomalies..."):
-            alerts = volume_detector.scan(markets)
-            all_alerts.extend(alerts)
-            console.print(f"  Volume anomalies: {len(alerts)} alerts")
+        with console.status("Fetching and analyzing markets..."):
+            results = run_detectors(
+                fetcher,
+                {
+                    "Large trades": large_trade_detector,
+                    "Volume anomalies": volume_detector,
+                    "Wallet clusters": cluster_detector,
+                },
+                markets,
+            )
 
-        with console.status("Analyzing wallet clusters..."):
-            alerts = cluster_detector.scan(markets)
+        for label, alerts in results.items():
             all_alerts.extend(alerts)
-            console.print(f"  Wallet clusters: {len(alerts)} alerts")
+            console.print(f"  {label}: {len(alerts)} alerts")
 
         console.print()
 
         # Sort by severity
-        all_alerts.sort(key=lambda a: a.score, reverse=True)
+        all_alerts.sort(key=attrgetter("score"), reverse=True)
 
         if args.verbose:
             for alert in all_alerts:
@@ -181,6 +260,10 @@ def cmd_scan(args: argparse.Namespace) -> int:
 
 def cmd_analyze(args: argparse.Namespace) -> int:
     """Execute analyze command."""
+    from .api import DataClient, GammaClient, TradeFetcher
+    from .detectors import LargeTradeDetector, VolumeAnomalyDetector
+    from .utils import console, print_alert, print_alerts_summary, print_market
+
     with GammaClient() as gamma, DataClient() as data:
         # Find market
         with console.status(f"Finding market '{args.market}'..."):
@@ -195,21 +278,20 @@ def cmd_analyze(args: argparse.Namespace) -> int:
         console.print("[bold]Market Info[/]")
         print_market(market)
 
-        # Run all detectors on this market
-        large_trade_detector = LargeTradeDetector(gamma, data)
-        volume_detector = VolumeAnomalyDetector(gamma, data)
-
-        all_alerts = []
+        # Run all detectors on this market, fetching its trades only once
+        fetcher = TradeFetcher(data)
+        large_trade_detector = LargeTradeDetector(gamma, fetcher)
+        volume_detector = VolumeAnomalyDetector(gamma, fetcher)
 
         with console.status("Analyzing..."):
-            alerts = large_trade_detector.analyze_market(market)
-            all_alerts.extend(alerts)
-
-            alert = volume_detector.analyze_market(market)
-            if alert:
-                all_alerts.append(alert)
+            results = run_detectors(
+                fetcher,
+                {"large": large_trade_detector, "volume": volume_detector},
+                [market],
+            )
+        all_alerts = [a for alerts in results.values() for a in alerts]
 
-        all_alerts.sort(key=lambda a: a.score, reverse=True)
+        all_alerts.sort(key=attrgetter("score"), reverse=True)
 
         if all_alerts:
             console.print(f"[bold]Found {len(all_alerts)} suspicious signals[/]\n")
@@ -226,6 +308,13 @@ def cmd_analyze(args: argparse.Namespace) -> int:
 
 def cmd_wallet(args: argparse.Namespace) -> int:
     """Execute wallet command."""
+    from datetime import datetime
+
+    import numpy as np
+
+    from .api import DataClient
+    from .utils import console, format_usd, format_wallet
+
     address = args.address
     if not address.startswith("0x"):
         console.print("[red]Invalid wallet address (must start with 0x)[/]")
@@ -233,36 +322,45 @@ def cmd_wallet(args: argparse.Namespace) -> int:
 
     with DataClient() as data:
         with console.status(f"Fetching trades for {format_wallet(address)}..."):
-            trades = data.get_wallet_trades(address, limit=args.limit)
+            trades = data.get_trades_arrays(user=address, limit=args.limit)
 
-        if not trades:
+        trade_count = len(trades["usd_value"])
+        if not trade_count:
             console.print(f"[yellow]No trades found for wallet {format_wallet(address)}[/]")
             return 0
 
         console.print(f"[bold]Wallet: {format_wallet(address, 20)}[/]")
-        console.print(f"Found {len(trades)} recent trades\n")
-
-        # Group by market
-        from collections import defaultdict
-        by_market: dict[str, list] = defaultdict(list)
-        for trade in trades:
-            by_market[trade.market_question[:50]].append(trade)
-
-        for market_name, market_trades in by_market.items():
-            total_volume = sum(t.usd_value for t in market_trades)
-            console.print(f"[bold]{market_name}[/]")
-            console.print(f"  Trades: {len(market_trades)}, Volume: {format_usd(total_volume)}")
-
-            for trade in market_trades[:5]:
-                side_color = "green" if trade.side.value == "BUY" else "red"
+        console.print(f"Found {trade_count} recent trades\n")
+
+        # Group by market with vectorized counts and sums
+        market_keys = np.array([q[:50] for q in trades["market_question"]], dtype=object)
+        market_names, first_seen, group = np.unique(
+            market_keys, return_index=True, return_inverse=True
+        )
+        counts = np.bincount(group)
+        volumes = np.bincount(group, weights=trades["usd_value"])
+
+        # Trade positions ordered by group, newest first within each group
+        by_group = np.argsort(group, kind="stable")
+        group_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # Show markets in the order the wallet last traded them
+        for g in np.argsort(first_seen):
+            console.print(f"[bold]{market_names[g]}[/]")
+            console.print(f"  Trades: {counts[g]}, Volume: {format_usd(volumes[g])}")
+
+            for i in by_group[group_starts[g]:group_starts[g] + 5]:
+                side = trades["side"][i]
+                side_color = "green" if side == "BUY" else "red"
+                timestamp = datetime.fromtimestamp(trades["timestamp"][i])
                 console.print(
-                    f"    [{side_color}]{trade.side.value}[/] {trade.outcome} "
-                    f"@ {trade.price:.1%} ({format_usd(trade.usd_value)}) "
-                    f"[dim]{trade.timestamp.strftime('%m/%d %H:%M')}[/]"
+                    f"    [{side_color}]{side}[/] {trades['outcome'][i]} "
+                    f"@ {trades['price'][i]:.1%} ({format_usd(trades['usd_value'][i])}) "
+                    f"[dim]{timestamp.strftime('%m/%d %H:%M')}[/]"
                 )
 
-            if len(market_trades) > 5:
-                console.print(f"    [dim]... and {len(market_trades) - 5} more[/]")
+            if counts[g] > 5:
+                console.print(f"    [dim]... and {counts[g] - 5} more[/]")
             console.print()
 
     return 0
@@ -270,6 +368,9 @@ def cmd_wallet(args: argparse.Namespace) -> int:
 
 def cmd_markets(args: argparse.Namespace) -> int:
     """Execute markets command."""
+    from .api import GammaClient
+    from .utils import console, print_markets_table
+
     with GammaClient() as gamma:
         with console.status("Fetching markets..."):
             markets = gamma.get_high_volume_markets(
@@ -287,8 +388,18 @@ def cmd_markets(args: argparse.Namespace) -> int:
 
 def cmd_watch(args: argparse.Namespace) -> int:
     """Execute watch command - continuous monitoring."""
+    import hashlib
+    import time
+    from collections import OrderedDict
+    from datetime import datetime
+
+    from .api import DataClient, GammaClient, TradeFetcher
+    from .detectors import LargeTradeDetector, VolumeAnomalyDetector, WalletClusterDetector
+    from .utils import console, format_usd, print_alert
+
     interval_seconds = args.interval * 60
-    seen_alerts: set[str] = set()
+    # Insertion-ordered so the oldest keys can be evicted once full
+    seen_alerts: OrderedDict[tuple, None] = OrderedDict()
 
     console.print(f"[bold]Starting continuous monitoring[/]")
     console.print(f"Interval: {args.interval} minutes")
@@ -296,11 +407,20 @@ def cmd_watch(args: argparse.Namespace) -> int:
     console.print("Press Ctrl+C to stop\n")
 
     try:
-        while True:
-            scan_time = datetime.utcnow()
-            console.print(f"[dim]Scan started at {scan_time.strftime('%H:%M:%S UTC')}[/]")
+        # Reuse the same clients across ticks to keep pooled connections alive
+        with GammaClient() as gamma, DataClient() as data:
+            # Refilled every tick and shared by all detectors
+            fetcher = TradeFetcher(data)
+            large_trade_detector = LargeTradeDetector(gamma, fetcher)
+            volume_detector = VolumeAnomalyDetector(gamma, fetcher)
+            cluster_detector = WalletClusterDetector(gamma, fetcher)
+
+            next_scan = time.monotonic()
+            while True:
+                next_scan += interval_seconds
+                scan_time = datetime.utcnow()
+                console.print(f"[dim]Scan started at {scan_time.strftime('%H:%M:%S UTC')}[/]")
 
-            with GammaClient() as gamma, DataClient() as data:
                 markets = gamma.get_high_volume_markets(
                     min_volume_24h=args.min_volume, limit=20
                 )
@@ -308,32 +428,59 @@ def cmd_watch(args: argparse.Namespace) -> int:
                 if not markets:
                     console.print("[yellow]No markets to monitor[/]")
                 else:
-                    large_trade_detector = LargeTradeDetector(gamma, data)
-                    volume_detector = VolumeAnomalyDetector(gamma, data)
-                    cluster_detector = WalletClusterDetector(gamma, data)
-
-                    all_alerts = []
-                    all_alerts.extend(large_trade_detector.scan(markets))
-                    all_alerts.extend(volume_detector.scan(markets))
-                    all_alerts.extend(cluster_detector.scan(markets))
+                    fetcher.clear()
+                    results = run_detectors(
+                        fetcher,
+                        {
+                            "large": large_trade_detector,
+                            "volume": volume_detector,
+                            "cluster": cluster_detector,
+                        },
+                        markets,
+                    )
+                    all_alerts = [a for alerts in results.values() for a in alerts]
 
                     # Filter to new alerts only
                     new_alerts = []
                     for alert in all_alerts:
-                        alert_key = f"{alert.signal_type}:{alert.market.condition_id}:{alert.description}"
+                        # Small fixed-size key instead of the full description text
+                        alert_key = (
+                            alert.signal_type,
+                            alert.market.condition_id,
+                            hashlib.blake2b(
+                                alert.description.encode(), digest_size=8
+                            ).digest(),
+                        )
                         if alert_key not in seen_alerts:
-                            seen_alerts.add(alert_key)
+                            seen_alerts[alert_key] = None
                             new_alerts.append(alert)
+                    while len(seen_alerts) > MAX_SEEN_ALERTS:
+                        seen_alerts.popitem(last=False)
 
                     if new_alerts:
                         console.print(f"\n[bold red]NEW ALERTS ({len(new_alerts)})[/]\n")
-                        for alert in sorted(new_alerts, key=lambda a: a.score, reverse=True):
+                        for alert in sorted(new_alerts, key=attrgetter("score"), reverse=True):
                             print_alert(alert)
                     else:
                         console.print("[dim]No new suspicious activity[/]")
 
-            console.print(f"[dim]Next scan in {args.interval} minutes...[/]\n")
-            time.sleep(interval_seconds)
+                # Keep a fixed cadence; if a scan overran, skip the missed
+                # ticks instead of starting scans back to back
+                now = time.monotonic()
+                if not interval_seconds:
+                    # No cadence to keep: start the next scan right away
+                    next_scan = now
+                elif now > next_scan:
+                    skipped = int((now - next_scan) // interval_seconds) + 1
+                    next_scan += skipped * interval_seconds
+                    console.print(
+                        f"[yellow]Scan overran the {args.interval} minute interval, "
+                        f"skipping {skipped} tick(s)[/]"
+                    )
+
+                minutes_left = max(round((next_scan - now) / 60), 1) if interval_seconds else 0
+                console.print(f"[dim]Next scan in {minutes_left} minutes...[/]\n")
+                time.sleep(next_scan - now)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped.[/]")
@@ -359,6 +506,8 @@ def main() -> int:
 
     cmd_func = commands.get(args.command)
     if cmd_func:
+        from .utils import console
+
         try:
             return cmd_func(args)
         except KeyboardInterrupt:
@@ -1,23 +1,53 @@
 """Detector for coordinated wallet trading patterns."""
 
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from itertools import chain
 from collections import defaultdict
-from typing import Optional
-
-import networkx as nx
-
-from ..models import Alert, Market, Trade, Severity, SignalType, WalletCluster
+from operator import attrgetter
+from typing import Optional, Union
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, triu
+from scipy.sparse.csgraph import connected_components
+
+from ..models import (
+    SIDE_BITS,
+    Alert,
+    Market,
+    Trade,
+    Side,
+    Severity,
+    SignalType,
+    WalletCluster,
+)
 from ..api.gamma import GammaClient
 from ..api.data import DataClient
+from ..api.fetcher import TradeFetcher
+
+# Severity score tiers: a value scores the entry for the tiers it reaches
+_CLUSTER_SIZE_TIERS = (3, 5, 10)
+_CLUSTER_SIZE_SCORES = (0, 1, 2, 3)
+_VOLUME_TIERS = (10000, 50000, 100000)
+_VOLUME_SCORES = (0, 1, 2, 3)
+_COORDINATION_TIERS = (0.8, 0.9)
+_COORDINATION_SCORES = (0, 1, 2)
+_MARKETS_TIERS = (3, 5)
+_MARKETS_SCORES = (0, 1, 2)
+_SEVERITY_TIERS = (3, 5, 8)
+_SEVERITY_LEVELS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
 
 
 class WalletClusterDetector:
     """Detects groups of wallets trading in coordinated patterns."""
 
+    # Clusters span markets, so a scan needs every market's trades at once
+    cross_market = True
+
     def __init__(
         self,
         gamma_client: GammaClient,
-        data_client: DataClient,
+        data_client: Union[DataClient, TradeFetcher],
         time_window_minutes: int = 30,
         min_cluster_size: int = 3,
         min_shared_markets: int = 2,
@@ -27,7 +57,8 @@ class WalletClusterDetector:
 
         Args:
             gamma_client: Client for market data
-            data_client: Client for trade data
+            data_client: Client for trade data (pass a TradeFetcher to share
+                fetched trades with other detectors)
             time_window_minutes: Window for considering trades as "coordinated"
             min_cluster_size: Minimum wallets to form a cluster
             min_shared_markets: Minimum markets traded together
@@ -53,10 +84,10 @@ class WalletClusterDetector:
             markets = self.gamma.get_high_volume_markets(limit=30)
 
         # Collect all trades across markets
-        all_trades: list[Trade] = []
-        for market in markets:
-            trades = self.data.get_trades(market=market.condition_id, limit=1000)
-            all_trades.extend(trades)
+        trades_by_market = self.data.get_trades_by_market(
+            [m.condition_id for m in markets], limit_per_market=1000
+        )
+        all_trades = list(chain.from_iterable(trades_by_market.values()))
 
         if not all_trades:
             return []
@@ -65,10 +96,14 @@ class WalletClusterDetector:
         wallet_activity = self._build_wallet_activity(all_trades)
 
         # Build co-trading graph
-        graph = self._build_cotrade_graph(all_trades, wallet_activity)
+        wallets, adjacency, coordination = self._build_cotrade_graph(
+            all_trades, wallet_activity
+        )
 
         # Find clusters
-        clusters = self._find_clusters(graph, wallet_activity)
+        clusters = self._find_clusters(
+            wallets, adjacency, coordination, wallet_activity
+        )
 
         # Generate alerts
         alerts = []
@@ -79,28 +114,28 @@ class WalletClusterDetector:
             if alert:
                 alerts.append(alert)
 
-        return sorted(alerts, key=lambda a: a.score, reverse=True)
+        return sorted(alerts, key=attrgetter("score"), reverse=True)
 
     def _build_wallet_activity(
         self, trades: list[Trade]
-    ) -> dict[str, dict[str, list[Trade]]]:
-        """Build mapping of wallet -> market -> trades.
+    ) -> dict[tuple[str, str], list[Trade]]:
+        """Build mapping of (wallet, market) -> trades.
 
         Returns:
-            Nested dict: wallet_activity[wallet][market_id] = [trades]
+            Flat dict: wallet_activity[(wallet, market_id)] = [trades]
         """
-        activity: dict[str, dict[str, list[Trade]]] = defaultdict(lambda: defaultdict(list))
+        activity: dict[tuple[str, str], list[Trade]] = defaultdict(list)
 
         for trade in trades:
-            activity[trade.wallet][trade.market_id].append(trade)
+            activity[(trade.wallet, trade.market_id)].append(trade)
 
         return activity
 
     def _build_cotrade_graph(
         self,
         trades: list[Trade],
-        wallet_activity: dict[str, dict[str, list[Trade]]],
-    ) -> nx.Graph:
+        wallet_activity: dict[tuple[str, str], list[Trade]],
+    ) -> tuple[list[str], coo_matrix, np.ndarray]:
         """Build graph where wallets are connected if they trade together.
 
         Edges are weighted by:
@@ -108,67 +143,102 @@ class WalletClusterDetector:
         - Trading within time window
         - Same side trading
 
+        Co-trading is counted with sparse products of wallet x (market,
+        time bucket) incidence matrices rather than by looping over every
+        wallet pair in each bucket.
+
         Returns:
-            NetworkX graph of wallet relationships
+            Tuple of (wallets, adjacency, coordination): wallet addresses
+            indexed by node id, a sparse adjacency matrix weighted by
+            co-trade count, and each edge's coordination in the same order
+            as adjacency.row / adjacency.col
         """
-        graph = nx.Graph()
-
-        # Group trades by market and time bucket
-        market_time_trades: dict[str, dict[int, list[Trade]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
-
         bucket_size = self.time_window_minutes * 60  # seconds
 
-        for trade in trades:
-            bucket = int(trade.timestamp.timestamp() / bucket_size)
-            market_time_trades[trade.market_id][bucket].append(trade)
-
-        # Find co-trading relationships
-        edge_weights: dict[tuple[str, str], dict] = defaultdict(
-            lambda: {"count": 0, "same_side": 0, "markets": set()}
+        # Number wallets and (market, time bucket) slots as they appear
+        wallet_ids: dict[str, int] = {}
+        slot_ids: dict[tuple[str, int], int] = {}
+        slot_markets: list[str] = []
+        trade_wallets = np.empty(len(trades), dtype=np.int64)
+        trade_slots = np.empty(len(trades), dtype=np.int64)
+        trade_sides = np.empty(len(trades), dtype=np.int8)
+
+        for i, trade in enumerate(trades):
+            bucket = int(trade.epoch / bucket_size)
+            slot = (trade.market_id, bucket)
+            if slot not in slot_ids:
+                slot_ids[slot] = len(slot_ids)
+                slot_markets.append(trade.market_id)
+            trade_wallets[i] = wallet_ids.setdefault(trade.wallet, len(wallet_ids))
+            trade_slots[i] = slot_ids[slot]
+            trade_sides[i] = trade.side_bit
+
+        shape = (len(wallet_ids), len(slot_ids))
+
+        def incidence(mask: np.ndarray) -> csr_matrix:
+            """0/1 wallet x slot matrix of the trades selected by mask."""
+            ones = np.ones(int(mask.sum()), dtype=np.int64)
+            return csr_matrix(
+                (ones, (trade_wallets[mask], trade_slots[mask])), shape=shape
+            ).sign()
+
+        traded = incidence(np.ones(len(trades), dtype=bool))
+        bought = incidence((trade_sides & SIDE_BITS[Side.BUY]) != 0)
+        sold = incidence((trade_sides & SIDE_BITS[Side.SELL]) != 0)
+
+        # Buckets each pair shared, and those where their sides overlapped
+        # (both bought or both sold, minus buckets where both did both)
+        count = (traded @ traded.T).tocsr()
+        both_sides = bought.multiply(sold)
+        same_side = (
+            bought @ bought.T + sold @ sold.T - both_sides @ both_sides.T
+        ).tocsr()
+
+        # Distinct markets each pair shared a bucket in
+        slots_by_market: dict[str, list[int]] = defaultdict(list)
+        for slot_id, market_id in enumerate(slot_markets):
+            slots_by_market[market_id].append(slot_id)
+        traded_by_slot = traded.tocsc()
+        shared_markets = csr_matrix(count.shape, dtype=np.int64)
+        for slots in slots_by_market.values():
+            in_market = traded_by_slot[:, slots]
+            shared_markets = shared_markets + (in_market @ in_market.T).sign()
+        shared_markets = shared_markets.tocsr()
+
+        # Each unordered pair once
+        pairs = triu(count, k=1).tocoo()
+        rows, cols, counts = pairs.row, pairs.col, pairs.data
+        if not len(counts):
+            return [], coo_matrix((0, 0), dtype=np.int64), np.empty(0)
+        pair_shared = np.asarray(shared_markets[rows, cols]).ravel()
+        pair_same = np.asarray(same_side[rows, cols]).ravel()
+        coordination = pair_same / counts
+
+        keep = (pair_shared >= self.min_shared_markets) & (
+            coordination >= self.coordination_threshold
+        )
+        rows, cols = rows[keep], cols[keep]
+
+        # Only wallets with at least one edge become nodes
+        nodes = np.unique(np.concatenate([rows, cols]))
+        wallets = list(wallet_ids)
+        n = len(nodes)
+        adjacency = coo_matrix(
+            (
+                counts[keep],
+                (np.searchsorted(nodes, rows), np.searchsorted(nodes, cols)),
+            ),
+            shape=(n, n),
         )
 
-        for market_id, time_buckets in market_time_trades.items():
-            for bucket, bucket_trades in time_buckets.items():
-                wallets_in_bucket = defaultdict(list)
-                for trade in bucket_trades:
-                    wallets_in_bucket[trade.wallet].append(trade)
-
-                wallet_list = list(wallets_in_bucket.keys())
-                for i, w1 in enumerate(wallet_list):
-                    for w2 in wallet_list[i + 1:]:
-                        key = tuple(sorted([w1, w2]))
-                        edge_weights[key]["count"] += 1
-                        edge_weights[key]["markets"].add(market_id)
-
-                        # Check if same side
-                        w1_sides = {t.side for t in wallets_in_bucket[w1]}
-                        w2_sides = {t.side for t in wallets_in_bucket[w2]}
-                        if w1_sides & w2_sides:  # Intersection
-                            edge_weights[key]["same_side"] += 1
-
-        # Add edges to graph
-        for (w1, w2), data in edge_weights.items():
-            if len(data["markets"]) >= self.min_shared_markets:
-                coordination = (
-                    data["same_side"] / data["count"] if data["count"] > 0 else 0
-                )
-                if coordination >= self.coordination_threshold:
-                    graph.add_edge(
-                        w1,
-                        w2,
-                        weight=data["count"],
-                        markets=data["markets"],
-                        coordination=coordination,
-                    )
-
-        return graph
+        return [wallets[i] for i in nodes], adjacency, coordination[keep]
 
     def _find_clusters(
         self,
-        graph: nx.Graph,
-        wallet_activity: dict[str, dict[str, list[Trade]]],
+        wallets: list[str],
+        adjacency: coo_matrix,
+        coordination: np.ndarray,
+        wallet_activity: dict[tuple[str, str], list[Trade]],
     ) -> list[WalletCluster]:
         """Find wallet clusters using connected components.
 
@@ -176,39 +246,53 @@ class WalletClusterDetector:
             List of WalletCluster objects
         """
         clusters = []
+        if not wallets:
+            return clusters
 
-        for component in nx.connected_components(graph):
+        n_components, labels = connected_components(adjacency, directed=False)
+
+        # Average edge coordination per component
+        edge_labels = labels[adjacency.row]
+        coordination_sums = np.bincount(
+            edge_labels, weights=coordination, minlength=n_components
+        )
+        edge_counts = np.bincount(edge_labels, minlength=n_components)
+
+        # Group node ids by component, keeping node order within each
+        order = np.argsort(labels, kind="stable")
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+
+        for component in np.split(order, boundaries):
             if len(component) < self.min_cluster_size:
                 continue
 
-            wallets = list(component)
-            subgraph = graph.subgraph(wallets)
+            label = labels[component[0]]
+            cluster_wallets = [wallets[i] for i in component]
 
             # Calculate cluster metrics
             all_markets: set[str] = set()
             total_volume = 0.0
             all_timestamps: list[datetime] = []
 
-            for wallet in wallets:
-                for market_id, trades in wallet_activity[wallet].items():
-                    all_markets.add(market_id)
-                    for trade in trades:
-                        total_volume += trade.usd_value
-                        all_timestamps.append(trade.timestamp)
+            wallet_set = set(cluster_wallets)
+            for (wallet, market_id), trades in wallet_activity.items():
+                if wallet not in wallet_set:
+                    continue
+                all_markets.add(market_id)
+                for trade in trades:
+                    total_volume += trade.usd_value
+                    all_timestamps.append(trade.timestamp)
 
             # Calculate coordination score
-            edge_coordinations = [
-                d.get("coordination", 0) for _, _, d in subgraph.edges(data=True)
-            ]
             avg_coordination = (
-                sum(edge_coordinations) / len(edge_coordinations)
-                if edge_coordinations
+                float(coordination_sums[label] / edge_counts[label])
+                if edge_counts[label]
                 else 0
             )
 
             if all_timestamps:
                 cluster = WalletCluster(
-                    wallets=wallets,
+                    wallets=cluster_wallets,
                     markets=list(all_markets),
                     total_volume=total_volume,
                     coordination_score=avg_coordination,
@@ -222,7 +306,7 @@ class WalletClusterDetector:
     def _create_cluster_alert(
         self,
         cluster: WalletCluster,
-        wallet_activity: dict[str, dict[str, list[Trade]]],
+        wallet_activity: dict[tuple[str, str], list[Trade]],
         market_lookup: dict[str, Market],
     ) -> Optional[Alert]:
         """Create an alert for a suspicious cluster."""
@@ -241,7 +325,7 @@ class WalletClusterDetector:
         trades: list[Trade] = []
         for wallet in cluster.wallets:
             for market_id in cluster.markets:
-                trades.extend(wallet_activity[wallet].get(market_id, []))
+                trades.extend(wallet_activity.get((wallet, market_id), []))
 
         return Alert(
             signal_type=SignalType.WALLET_CLUSTER,
@@ -267,37 +351,17 @@ class WalletClusterDetector:
         score = 0
 
         # Cluster size
-        if len(cluster.wallets) >= 10:
-            score += 3
-        elif len(cluster.wallets) >= 5:
-            score += 2
-        elif len(cluster.wallets) >= 3:
-            score += 1
+        score += _CLUSTER_SIZE_SCORES[bisect_right(_CLUSTER_SIZE_TIERS, len(cluster.wallets))]
 
         # Total volume
-        if cluster.total_volume >= 100000:
-            score += 3
-        elif cluster.total_volume >= 50000:
-            score += 2
-        elif cluster.total_volume >= 10000:
-            score += 1
+        score += _VOLUME_SCORES[bisect_right(_VOLUME_TIERS, cluster.total_volume)]
 
         # Coordination score
-        if cluster.coordination_score >= 0.9:
-            score += 2
-        elif cluster.coordination_score >= 0.8:
-            score += 1
+        score += _COORDINATION_SCORES[
+            bisect_right(_COORDINATION_TIERS, cluster.coordination_score)
+        ]
 
         # Markets involved
-        if len(cluster.markets) >= 5:
-            score += 2
-        elif len(cluster.markets) >= 3:
-            score += 1
-
-        if score >= 8:
-            return Severity.CRITICAL
-        elif score >= 5:
-            return Severity.HIGH
-        elif score >= 3:
-            return Severity.MEDIUM
-        return Severity.LOW
+        score += _MARKETS_SCORES[bisect_right(_MARKETS_TIERS, len(cluster.markets))]
+
+        return _SEVERITY_LEVELS[bisect_right(_SEVERITY_TIERS, score)]
@@ -1,35 +1,61 @@
 """Detector for unusually large trades before market resolution."""
 
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
-import statistics
+from itertools import chain
+from operator import attrgetter
+from typing import Optional, Union
+
+import numpy as np
 
 from ..models import Alert, Market, Trade, Severity, SignalType
 from ..api.gamma import GammaClient
 from ..api.data import DataClient
+from ..api.fetcher import TradeFetcher
+
+# Markets whose sorted trade sizes are kept between scans
+SORTED_SIZES_CACHE_SIZE = 256
+
+# Severity score tiers: a value scores the entry for the tiers it reaches
+_PERCENTILE_TIERS = (95, 97, 99)
+_PERCENTILE_SCORES = (0, 1, 2, 3)
+_HOURS_TO_RESOLUTION_TIERS = (2, 6, 12)  # at or under
+_HOURS_TO_RESOLUTION_SCORES = (3, 2, 1, 0)
+_USD_TIERS = (10000, 50000)
+_USD_SCORES = (0, 1, 2)
+_SEVERITY_TIERS = (3, 5, 7)
+_SEVERITY_LEVELS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
 
 
 class LargeTradeDetector:
     """Detects unusually large trades placed shortly before market resolution."""
 
+    # Each market is analyzed on its own, so scans can run market by market
+    cross_market = False
+
     def __init__(
         self,
         gamma_client: GammaClient,
-        data_client: DataClient,
+        data_client: Union[DataClient, TradeFetcher],
         size_percentile: float = 95.0,
         time_window_hours: int = 24,
         min_trade_usd: float = 1000,
         high_confidence_threshold: float = 0.85,
+        top_n: int = 200,
     ):
         """Initialize the detector.
 
         Args:
             gamma_client: Client for market data
-            data_client: Client for trade data
+            data_client: Client for trade data (pass a TradeFetcher to share
+                fetched trades with other detectors)
             size_percentile: Flag trades above this percentile
             time_window_hours: Hours before resolution to monitor
             min_trade_usd: Minimum trade size to consider
             high_confidence_threshold: Price threshold for "confident" bets
+            top_n: Max alerts returned by scan, highest scores first
         """
         self.gamma = gamma_client
         self.data = data_client
@@ -37,6 +63,9 @@ class LargeTradeDetector:
         self.time_window_hours = time_window_hours
         self.min_trade_usd = min_trade_usd
         self.high_confidence_threshold = high_confidence_threshold
+        self.top_n = top_n
+        # Sorted trade sizes per trade window, reused while the window is unchanged
+        self._sorted_sizes_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
 
     def scan(self, markets: Optional[list[Market]] = None) -> list[Alert]:
         """Scan markets for suspicious large trades.
@@ -52,12 +81,8 @@ class LargeTradeDetector:
                 hours=self.time_window_hours
             )
 
-        alerts = []
-        for market in markets:
-            market_alerts = self.analyze_market(market)
-            alerts.extend(market_alerts)
-
-        return sorted(alerts, key=lambda a: a.score, reverse=True)
+        alerts = chain.from_iterable(map(self.analyze_market, markets))
+        return heapq.nlargest(self.top_n, alerts, key=attrgetter("score"))
 
     def analyze_market(self, market: Market) -> list[Alert]:
         """Analyze a single market for suspicious large trades.
@@ -68,28 +93,33 @@ class LargeTradeDetector:
         Returns:
             List of alerts
         """
-        trades = self.data.get_trades(
-            market=market.condition_id, limit=2000
-        )
+        trades = self.data.get_trades(market=market.condition_id, limit=2000)
 
         if len(trades) < 10:
             return []
 
-        trade_sizes = [t.usd_value for t in trades]
-        threshold = self._calculate_percentile(trade_sizes, self.size_percentile)
+        sizes = np.fromiter((t.usd_value for t in trades), dtype=np.float64, count=len(trades))
+        epochs = np.fromiter((t.epoch for t in trades), dtype=np.float64, count=len(trades))
+
+        sorted_sizes = self._get_sorted_sizes(market.condition_id, trades, sizes)
+        n = len(sorted_sizes)
+        threshold = sorted_sizes[min(int(n * self.size_percentile / 100), n - 1)]
 
         now = datetime.utcnow()
         window_start = now - timedelta(hours=self.time_window_hours)
 
-        alerts = []
-        for trade in trades:
-            if trade.timestamp < window_start:
-                continue
+        # Only trades that are both recent and large enough reach Python
+        candidates = np.flatnonzero(
+            (epochs >= window_start.timestamp())
+            & (sizes >= max(threshold, self.min_trade_usd))
+        )
 
-            if trade.usd_value < max(threshold, self.min_trade_usd):
-                continue
+        counts_below = np.searchsorted(sorted_sizes, sizes[candidates], side="left")
 
-            percentile = self._get_percentile_rank(trade_sizes, trade.usd_value)
+        alerts = []
+        for i, count_below in zip(candidates.tolist(), counts_below.tolist()):
+            trade = trades[i]
+            percentile = count_below / n * 100
             severity = self._calculate_severity(
                 trade, market, percentile
             )
@@ -125,6 +155,28 @@ class LargeTradeDetector:
 
         return alerts
 
+    def _get_sorted_sizes(
+        self, market_id: str, trades: list[Trade], sizes: np.ndarray
+    ) -> np.ndarray:
+        """Get the market's trade sizes in USD, sorted ascending.
+
+        Sorting once lets the threshold be an index into the result and
+        each trade's percentile rank a binary search. Trades are newest
+        first, so the same newest and oldest trade and count mean the same
+        window, and the previous sort is reused (e.g. between watch ticks).
+        """
+        key = (market_id, len(trades), trades[0].transaction_hash, trades[-1].transaction_hash)
+        sorted_sizes = self._sorted_sizes_cache.get(key)
+        if sorted_sizes is not None:
+            self._sorted_sizes_cache.move_to_end(key)
+            return sorted_sizes
+
+        sorted_sizes = np.sort(sizes)
+        self._sorted_sizes_cache[key] = sorted_sizes
+        while len(self._sorted_sizes_cache) > SORTED_SIZES_CACHE_SIZE:
+            self._sorted_sizes_cache.popitem(last=False)
+        return sorted_sizes
+
     def _calculate_severity(
         self, trade: Trade, market: Market, percentile: float
     ) -> Severity:
@@ -132,12 +184,7 @@ class LargeTradeDetector:
         score = 0
 
         # Size factor
-        if percentile >= 99:
-            score += 3
-        elif percentile >= 97:
-            score += 2
-        elif percentile >= 95:
-            score += 1
+        score += _PERCENTILE_SCORES[bisect_right(_PERCENTILE_TIERS, percentile)]
 
         # Confidence factor (betting at extreme prices)
         if trade.price >= self.high_confidence_threshold:
@@ -150,39 +197,11 @@ class LargeTradeDetector:
             hours_to_resolution = (
                 market.end_date - trade.timestamp
             ).total_seconds() / 3600
-            if hours_to_resolution <= 2:
-                score += 3
-            elif hours_to_resolution <= 6:
-                score += 2
-            elif hours_to_resolution <= 12:
-                score += 1
+            score += _HOURS_TO_RESOLUTION_SCORES[
+                bisect_left(_HOURS_TO_RESOLUTION_TIERS, hours_to_resolution)
+            ]
 
         # USD value factor
-        if trade.usd_value >= 50000:
-            score += 2
-        elif trade.usd_value >= 10000:
-            score += 1
+        score += _USD_SCORES[bisect_right(_USD_TIERS, trade.usd_value)]
 
-        if score >= 7:
-            return Severity.CRITICAL
-        elif score >= 5:
-            return Severity.HIGH
-        elif score >= 3:
-            return Severity.MEDIUM
-        return Severity.LOW
-
-    def _calculate_percentile(self, values: list[float], percentile: float) -> float:
-        """Calculate the value at a given percentile."""
-        if not values:
-            return 0.0
-        sorted_values = sorted(values)
-        index = int(len(sorted_values) * percentile / 100)
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
-
-    def _get_percentile_rank(self, values: list[float], value: float) -> float:
-        """Get the percentile rank of a value in a distribution."""
-        if not values:
-            return 0.0
-        count_below = sum(1 for v in values if v < value)
-        return (count_below / len(values)) * 100
+        return _SEVERITY_LEVELS[bisect_right(_SEVERITY_TIERS, score)]
@@ -1,39 +1,61 @@
 """Detector for volume anomalies in market trading."""
 
+import heapq
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import Optional
-import statistics
+from operator import attrgetter
+from typing import Optional, Union
+
+import numpy as np
 
 from ..models import Alert, Market, Severity, SignalType, VolumeStats
 from ..api.gamma import GammaClient
 from ..api.data import DataClient
+from ..api.fetcher import TradeFetcher
+
+# Severity score tiers: a value scores the entry for the tiers it reaches
+_Z_SCORE_TIERS = (3, 4, 5, 6)
+_Z_SCORE_SCORES = (0, 1, 2, 3, 4)
+_VOLUME_TIERS = (50000, 100000)
+_VOLUME_SCORES = (0, 1, 2)
+_HOURS_TO_END_TIERS = (24, 72)  # at or under
+_HOURS_TO_END_SCORES = (2, 1, 0)
+_SEVERITY_TIERS = (2, 4, 6)
+_SEVERITY_LEVELS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
 
 
 class VolumeAnomalyDetector:
     """Detects unusual volume spikes that deviate from normal patterns."""
 
+    # Each market is analyzed on its own, so scans can run market by market
+    cross_market = False
+
     def __init__(
         self,
         gamma_client: GammaClient,
-        data_client: DataClient,
+        data_client: Union[DataClient, TradeFetcher],
         z_score_threshold: float = 3.0,
         lookback_days: int = 7,
         min_trades_for_baseline: int = 50,
+        top_n: int = 200,
     ):
         """Initialize the detector.
 
         Args:
             gamma_client: Client for market data
-            data_client: Client for trade data
+            data_client: Client for trade data (pass a TradeFetcher to share
+                fetched trades with other detectors)
             z_score_threshold: Standard deviations above mean to flag
             lookback_days: Days of history for baseline calculation
             min_trades_for_baseline: Minimum trades needed for analysis
+            top_n: Max alerts returned by scan, highest scores first
         """
         self.gamma = gamma_client
         self.data = data_client
         self.z_score_threshold = z_score_threshold
         self.lookback_days = lookback_days
         self.min_trades_for_baseline = min_trades_for_baseline
+        self.top_n = top_n
 
     def scan(self, markets: Optional[list[Market]] = None) -> list[Alert]:
         """Scan markets for volume anomalies.
@@ -47,13 +69,8 @@ class VolumeAnomalyDetector:
         if markets is None:
             markets = self.gamma.get_high_volume_markets(limit=50)
 
-        alerts = []
-        for market in markets:
-            alert = self.analyze_market(market)
-            if alert:
-                alerts.append(alert)
-
-        return sorted(alerts, key=lambda a: a.score, reverse=True)
+        alerts = filter(None, map(self.analyze_market, markets))
+        return heapq.nlargest(self.top_n, alerts, key=attrgetter("score"))
 
     def analyze_market(self, market: Market) -> Optional[Alert]:
         """Analyze a single market for volume anomalies.
@@ -64,30 +81,34 @@ class VolumeAnomalyDetector:
         Returns:
             Alert if anomaly detected, None otherwise
         """
-        trades = self.data.get_trades(market=market.condition_id, limit=5000)
+        # Only two columns are needed, so work on arrays rather than Trades
+        columns = self.data.get_trades_arrays(
+            market=market.condition_id, limit=5000, columns=("timestamp", "usd_value")
+        )
+        epochs, usd_values = columns["timestamp"], columns["usd_value"]
 
-        if len(trades) < self.min_trades_for_baseline:
+        if len(epochs) < self.min_trades_for_baseline:
             return None
 
         now = datetime.utcnow()
         lookback_start = now - timedelta(days=self.lookback_days)
 
         # Calculate hourly volumes
-        hourly_volumes = self._calculate_hourly_volumes(trades, lookback_start)
+        hourly_volumes = self._calculate_hourly_volumes(epochs, usd_values, lookback_start)
 
         if len(hourly_volumes) < 24:
             return None
 
         # Get recent vs historical volumes
         recent_hours = 6
-        recent_volume = sum(hourly_volumes[-recent_hours:]) if len(hourly_volumes) >= recent_hours else 0
+        recent_volume = float(hourly_volumes[-recent_hours:].sum()) if len(hourly_volumes) >= recent_hours else 0
         historical_volumes = hourly_volumes[:-recent_hours] if len(hourly_volumes) > recent_hours else hourly_volumes
 
-        if not historical_volumes:
+        if not historical_volumes.size:
             return None
 
-        mean_volume = statistics.mean(historical_volumes)
-        std_volume = statistics.stdev(historical_volumes) if len(historical_volumes) > 1 else 1
+        mean_volume = float(historical_volumes.mean())
+        std_volume = float(historical_volumes.std(ddof=1)) if len(historical_volumes) > 1 else 1
 
         if std_volume == 0:
             std_volume = mean_volume * 0.1 or 1
@@ -128,29 +149,27 @@ class VolumeAnomalyDetector:
         )
 
     def _calculate_hourly_volumes(
-        self, trades: list, start_time: datetime
-    ) -> list[float]:
+        self, epochs: np.ndarray, usd_values: np.ndarray, start_time: datetime
+    ) -> np.ndarray:
         """Calculate hourly trading volumes.
 
         Args:
-            trades: List of trades
+            epochs: Trade times in epoch seconds
+            usd_values: Trade USD values, aligned with epochs
             start_time: Start of analysis period
 
         Returns:
-            List of hourly volumes in USD
+            Array of hourly volumes in USD, oldest hour first
         """
         now = datetime.utcnow()
         hours = int((now - start_time).total_seconds() / 3600) + 1
-        hourly_volumes = [0.0] * hours
 
-        for trade in trades:
-            if trade.timestamp < start_time:
-                continue
-            hour_index = int((trade.timestamp - start_time).total_seconds() / 3600)
-            if 0 <= hour_index < len(hourly_volumes):
-                hourly_volumes[hour_index] += trade.usd_value
+        hour_index = ((epochs - start_time.timestamp()) // 3600).astype(np.int64)
+        in_range = (hour_index >= 0) & (hour_index < hours)
 
-        return hourly_volumes
+        return np.bincount(
+            hour_index[in_range], weights=usd_values[in_range], minlength=hours
+        )
 
     def _calculate_severity(
         self, z_score: float, volume: float, market: Market
@@ -159,33 +178,15 @@ class VolumeAnomalyDetector:
         score = 0
 
         # Z-score factor
-        if z_score >= 6:
-            score += 4
-        elif z_score >= 5:
-            score += 3
-        elif z_score >= 4:
-            score += 2
-        elif z_score >= 3:
-            score += 1
+        score += _Z_SCORE_SCORES[bisect_right(_Z_SCORE_TIERS, z_score)]
 
         # Absolute volume factor
-        if volume >= 100000:
-            score += 2
-        elif volume >= 50000:
-            score += 1
+        score += _VOLUME_SCORES[bisect_right(_VOLUME_TIERS, volume)]
 
         # Market proximity to resolution
         if market.end_date:
             hours_to_end = (market.end_date - datetime.utcnow()).total_seconds() / 3600
-            if 0 < hours_to_end <= 24:
-                score += 2
-            elif 0 < hours_to_end <= 72:
-                score += 1
-
-        if score >= 6:
-            return Severity.CRITICAL
-        elif score >= 4:
-            return Severity.HIGH
-        elif score >= 2:
-            return Severity.MEDIUM
-        return Severity.LOW
+            if hours_to_end > 0:
+                score += _HOURS_TO_END_SCORES[bisect_left(_HOURS_TO_END_TIERS, hours_to_end)]
+
+        return _SEVERITY_LEVELS[bisect_right(_SEVERITY_TIERS, score)]
@@ -3,7 +3,9 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Side(str, Enum):
@@ -11,6 +13,10 @@ class Side(str, Enum):
     SELL = "SELL"
 
 
+# Integer flags for Side, so sides can be combined and tested with | and &
+SIDE_BITS = {Side.BUY: 1, Side.SELL: 2}
+
+
 class Severity(str, Enum):
     LOW = "LOW"
     MEDIUM = "MEDIUM"
@@ -39,8 +45,14 @@ class Market(BaseModel):
     active: bool = True
 
 
-class Trade(BaseModel):
-    """Individual trade on Polymarket."""
+class Trade(msgspec.Struct, frozen=True, gc=False):
+    """Individual trade on Polymarket.
+
+    A msgspec Struct rather than a pydantic model: trades are built by the
+    thousand per scan from already-typed API rows, so they skip validation
+    and carry no per-instance __dict__. Fields are all scalars, so trades
+    can't form reference cycles and are left untracked by the cyclic GC.
+    """
 
     transaction_hash: str
     wallet: str
@@ -48,17 +60,30 @@ class Trade(BaseModel):
     market_slug: str
     market_question: str
     side: Side
+    side_bit: int  # SIDE_BITS[side]
     outcome: str
     outcome_index: int
     size: float  # Number of shares
     price: float  # Price per share (0-1)
     usd_value: float  # Total USD value
     timestamp: datetime
+    epoch: float  # Same instant as timestamp, in seconds since the epoch
+
+
+# Ranking weight of each severity, built once rather than per score lookup
+SEVERITY_SCORES = {
+    Severity.LOW: 1.0,
+    Severity.MEDIUM: 2.0,
+    Severity.HIGH: 3.0,
+    Severity.CRITICAL: 4.0,
+}
 
 
 class Alert(BaseModel):
     """Suspicious activity alert."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     signal_type: SignalType
     severity: Severity
     market: Market
@@ -71,13 +96,7 @@ class Alert(BaseModel):
     @property
     def score(self) -> float:
         """Numeric score for ranking alerts."""
-        severity_scores = {
-            Severity.LOW: 1.0,
-            Severity.MEDIUM: 2.0,
-            Severity.HIGH: 3.0,
-            Severity.CRITICAL: 4.0,
-        }
-        return severity_scores.get(self.severity, 0.0)
+        return SEVERITY_SCORES.get(self.severity, 0.0)
 
 
 class WalletCluster(BaseModel):
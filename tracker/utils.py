@@ -1,6 +1,8 @@
 """Utility functions for formatting and display."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
 from rich.console import Console
@@ -11,11 +13,58 @@ from rich.text import Text
 from .models import Alert, Market, Severity, SignalType
 
 
-console = Console()
-
-
+# Output is explicitly styled with markup, so skip Rich's per-line repr
+# highlighting and :emoji: substitution (market titles can contain colons)
+console = Console(highlight=False, emoji=False, log_path=False)
+
+# Display lookups, built once at import rather than on every call
+_SEVERITY_COLORS = {
+    Severity.LOW: "green",
+    Severity.MEDIUM: "yellow",
+    Severity.HIGH: "orange1",
+    Severity.CRITICAL: "red bold",
+}
+# Panel borders take a plain color, without modifiers like "bold"
+_SEVERITY_BORDERS = {
+    severity: color.split()[0] for severity, color in _SEVERITY_COLORS.items()
+}
+_SIGNAL_LABELS = {
+    SignalType.LARGE_TRADE_BEFORE_RESOLUTION: "[bold magenta]TRADE[/]",
+    SignalType.WALLET_CLUSTER: "[bold cyan]CLUSTER[/]",
+    SignalType.VOLUME_ANOMALY: "[bold yellow]VOLUME[/]",
+}
+# Plain names for the same labels, used when output is not a terminal
+_SIGNAL_NAMES = {
+    SignalType.LARGE_TRADE_BEFORE_RESOLUTION: "TRADE",
+    SignalType.WALLET_CLUSTER: "CLUSTER",
+    SignalType.VOLUME_ANOMALY: "VOLUME",
+}
+# Field labels in the alert body, with their "Label: " prefixes built once
+_FIELD_LABELS = (
+    "Market", "Description",
+    "Wallet", "Trade", "Price", "Size Percentile", "Time to Resolution",
+    "Z-Score", "Recent Volume", "Expected Volume", "Multiplier",
+    "Cluster Size", "Markets", "Total Volume", "Coordination",
+)
+_RICH_PREFIXES = {label: f"[bold]{label}:[/] " for label in _FIELD_LABELS}
+_PLAIN_PREFIXES = {label: f"{label}: " for label in _FIELD_LABELS}
+# Footer of the alert body
+_DETECTED_FORMAT = "[dim]Detected: %Y-%m-%d %H:%M UTC[/]"
+_PLAIN_DETECTED_FORMAT = "Detected: %Y-%m-%d %H:%M UTC"
+# Short type names for the summary table
+_SIGNAL_TITLES = {
+    signal_type: signal_type.value.replace("_", " ").title()[:15]
+    for signal_type in SignalType
+}
+
+
+@lru_cache(maxsize=4096)
 def format_usd(value: float) -> str:
-    """Format a USD value with appropriate precision."""
+    """Format a USD value with appropriate precision.
+
+    Cached because the same amounts (zero, a market's volume and liquidity)
+    are rendered many times across alert panels and tables.
+    """
     if value >= 1_000_000:
         return f"${value / 1_000_000:.2f}M"
     elif value >= 1_000:
@@ -33,19 +82,29 @@ def format_time_delta(delta: Optional[timedelta]) -> str:
     if total_seconds < 0:
         return "Expired"
 
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
+    # Output has minute resolution, so rows closing in the same minute share it
+    return _format_minutes(total_seconds // 60)
+
+
+@lru_cache(maxsize=1024)
+def _format_minutes(total_minutes: int) -> str:
+    """Format a non-negative number of minutes as "1d 2h", "2h 5m" or "5m"."""
+    days, remainder = divmod(total_minutes, 1440)
+    hours, minutes = divmod(remainder, 60)
 
-    if hours > 24:
-        days = hours // 24
-        hours = hours % 24
+    if days:
         return f"{days}d {hours}h"
-    elif hours > 0:
+    if hours:
         return f"{hours}h {minutes}m"
-    else:
-        return f"{minutes}m"
+    return f"{minutes}m"
+
+
+def _truncate(text: str, length: int) -> str:
+    """Cut text to length characters, adding "..." if anything was cut."""
+    return text if len(text) <= length else text[:length] + "..."
 
 
+@lru_cache(maxsize=2048)
 def format_wallet(address: str, length: int = 10) -> str:
     """Truncate wallet address for display."""
     if len(address) <= length:
@@ -56,26 +115,73 @@ def format_wallet(address: str, length: int = 10) -> str:
 
 def severity_color(severity: Severity) -> str:
     """Get color for severity level."""
-    colors = {
-        Severity.LOW: "green",
-        Severity.MEDIUM: "yellow",
-        Severity.HIGH: "orange1",
-        Severity.CRITICAL: "red bold",
-    }
-    return colors.get(severity, "white")
+    return _SEVERITY_COLORS.get(severity, "white")
 
 
 def signal_emoji(signal_type: SignalType) -> str:
     """Get emoji/symbol for signal type."""
-    symbols = {
-        SignalType.LARGE_TRADE_BEFORE_RESOLUTION: "[bold magenta]TRADE[/]",
-        SignalType.WALLET_CLUSTER: "[bold cyan]CLUSTER[/]",
-        SignalType.VOLUME_ANOMALY: "[bold yellow]VOLUME[/]",
-    }
-    return symbols.get(signal_type, "ALERT")
+    return _SIGNAL_LABELS.get(signal_type, "ALERT")
+
+
+def _trade_detail_fields(details: dict) -> list[tuple[str, str]]:
+    """Detail fields for a large trade alert."""
+    get = details.get
+    fields = [
+        ("Wallet", format_wallet(get('wallet', 'Unknown'))),
+        ("Trade", f"{format_usd(get('trade_usd', 0))} on {get('outcome', '?')}"),
+        ("Price", f"{get('price', 0):.1%}"),
+        ("Size Percentile", f"{get('percentile', 0):.1f}%"),
+    ]
+    hours = get('time_to_resolution_hours')
+    if hours:
+        fields.append(("Time to Resolution", f"{hours:.1f}h"))
+    return fields
+
+
+def _volume_detail_fields(details: dict) -> list[tuple[str, str]]:
+    """Detail fields for a volume anomaly alert."""
+    get = details.get
+    return [
+        ("Z-Score", f"{get('z_score', 0):.1f}"),
+        ("Recent Volume", format_usd(get('recent_volume_usd', 0))),
+        ("Expected Volume", format_usd(get('expected_volume_usd', 0))),
+        ("Multiplier", f"{get('volume_multiplier', 0):.1f}x"),
+    ]
+
+
+def _cluster_detail_fields(details: dict) -> list[tuple[str, str]]:
+    """Detail fields for a wallet cluster alert."""
+    get = details.get
+    return [
+        ("Cluster Size", f"{get('cluster_size', 0)} wallets"),
+        ("Markets", f"{get('markets_count', 0)} markets"),
+        ("Total Volume", format_usd(get('total_volume_usd', 0))),
+        ("Coordination", f"{get('coordination_score', 0):.0%}"),
+    ]
+
+
+_DETAIL_BUILDERS = {
+    SignalType.LARGE_TRADE_BEFORE_RESOLUTION: _trade_detail_fields,
+    SignalType.VOLUME_ANOMALY: _volume_detail_fields,
+    SignalType.WALLET_CLUSTER: _cluster_detail_fields,
+}
+
+
+def _alert_fields(alert: Alert) -> list[tuple[str, str]]:
+    """(label, value) pairs shown in an alert's body."""
+    fields = [
+        ("Market", alert.market.question[:80]),
+        ("Description", alert.description),
+    ]
+
+    # Add relevant details based on signal type
+    build_details = _DETAIL_BUILDERS.get(alert.signal_type)
+    if build_details is not None:
+        fields.extend(build_details(alert.details))
+    return fields
 
 
-def print_alert(alert: Alert) -> None:
+def _print_alert_rich(alert: Alert) -> None:
     """Print a formatted alert to console."""
     severity_style = severity_color(alert.severity)
     signal_label = signal_emoji(alert.signal_type)
@@ -84,56 +190,53 @@ def print_alert(alert: Alert) -> None:
     title.append(f"[{alert.severity.value}] ", style=severity_style)
     title.append(signal_label)
 
-    content_lines = [
-        f"[bold]Market:[/] {alert.market.question[:80]}",
-        f"[bold]Description:[/] {alert.description}",
-    ]
-
-    # Add relevant details based on signal type
-    if alert.signal_type == SignalType.LARGE_TRADE_BEFORE_RESOLUTION:
-        details = alert.details
-        content_lines.extend([
-            f"[bold]Wallet:[/] {format_wallet(details.get('wallet', 'Unknown'))}",
-            f"[bold]Trade:[/] {format_usd(details.get('trade_usd', 0))} on {details.get('outcome', '?')}",
-            f"[bold]Price:[/] {details.get('price', 0):.1%}",
-            f"[bold]Size Percentile:[/] {details.get('percentile', 0):.1f}%",
-        ])
-        if details.get('time_to_resolution_hours'):
-            content_lines.append(
-                f"[bold]Time to Resolution:[/] {details['time_to_resolution_hours']:.1f}h"
-            )
-
-    elif alert.signal_type == SignalType.VOLUME_ANOMALY:
-        details = alert.details
-        content_lines.extend([
-            f"[bold]Z-Score:[/] {details.get('z_score', 0):.1f}",
-            f"[bold]Recent Volume:[/] {format_usd(details.get('recent_volume_usd', 0))}",
-            f"[bold]Expected Volume:[/] {format_usd(details.get('expected_volume_usd', 0))}",
-            f"[bold]Multiplier:[/] {details.get('volume_multiplier', 0):.1f}x",
-        ])
-
-    elif alert.signal_type == SignalType.WALLET_CLUSTER:
-        details = alert.details
-        content_lines.extend([
-            f"[bold]Cluster Size:[/] {details.get('cluster_size', 0)} wallets",
-            f"[bold]Markets:[/] {details.get('markets_count', 0)} markets",
-            f"[bold]Total Volume:[/] {format_usd(details.get('total_volume_usd', 0))}",
-            f"[bold]Coordination:[/] {details.get('coordination_score', 0):.0%}",
-        ])
-
-    content_lines.append(f"[dim]Detected: {alert.timestamp.strftime('%Y-%m-%d %H:%M UTC')}[/]")
+    prefixes = _RICH_PREFIXES
+    content_lines = [prefixes[label] + value for label, value in _alert_fields(alert)]
+    content_lines.append(alert.timestamp.strftime(_DETECTED_FORMAT))
 
     panel = Panel(
         "\n".join(content_lines),
         title=title,
-        border_style=severity_style.split()[0],
+        border_style=_SEVERITY_BORDERS.get(alert.severity, "white"),
         padding=(0, 1),
     )
-    console.print(panel)
-    console.print()
+    # Trailing empty string gives the blank separator line in the same render
+    console.print(panel, "")
+
+
+def _print_alert_plain(alert: Alert) -> None:
+    """Write an alert as plain text lines."""
+    lines = [f"[{alert.severity.value}] {_SIGNAL_NAMES.get(alert.signal_type, 'ALERT')}"]
+    prefixes = _PLAIN_PREFIXES
+    lines.extend(prefixes[label] + value for label, value in _alert_fields(alert))
+    lines.append(alert.timestamp.strftime(_PLAIN_DETECTED_FORMAT))
+    console.file.write("\n".join(lines) + "\n\n")
 
 
-def print_alerts_summary(alerts: list[Alert]) -> None:
+def _summary_rows(alerts: list[Alert]):
+    """Yield (severity, type, market, details, time) cells for the summary."""
+    for alert in islice(alerts, 20):  # Limit to 20
+        signal_type = alert.signal_type
+        get = alert.details.get
+
+        # Brief detail based on type
+        if signal_type == SignalType.LARGE_TRADE_BEFORE_RESOLUTION:
+            detail = format_usd(get("trade_usd", 0))
+        elif signal_type == SignalType.VOLUME_ANOMALY:
+            detail = f"z={get('z_score', 0):.1f}"
+        else:
+            detail = f"{get('cluster_size', 0)} wallets"
+
+        yield (
+            alert.severity,
+            _SIGNAL_TITLES[signal_type],
+            _truncate(alert.market.question, 40),
+            detail,
+            alert.timestamp.strftime("%H:%M"),
+        )
+
+
+def _print_alerts_summary_rich(alerts: list[Alert]) -> None:
     """Print summary table of alerts."""
     if not alerts:
         console.print("[dim]No suspicious activity detected.[/]")
@@ -146,53 +249,85 @@ def print_alerts_summary(alerts: list[Alert]) -> None:
     table.add_column("Details")
     table.add_column("Time")
 
-    for alert in alerts[:20]:  # Limit to 20
-        severity_style = severity_color(alert.severity)
-        market_short = alert.market.question[:40] + ("..." if len(alert.market.question) > 40 else "")
+    add_row = table.add_row
+    for severity, *cells in _summary_rows(alerts):
+        add_row(f"[{severity_color(severity)}]{severity.value}[/]", *cells)
 
-        # Brief detail based on type
-        if alert.signal_type == SignalType.LARGE_TRADE_BEFORE_RESOLUTION:
-            detail = format_usd(alert.details.get("trade_usd", 0))
-        elif alert.signal_type == SignalType.VOLUME_ANOMALY:
-            detail = f"z={alert.details.get('z_score', 0):.1f}"
-        else:
-            detail = f"{alert.details.get('cluster_size', 0)} wallets"
+    console.print(table)
 
-        table.add_row(
-            Text(alert.severity.value, style=severity_style),
-            alert.signal_type.value.replace("_", " ").title()[:15],
-            market_short,
-            detail,
-            alert.timestamp.strftime("%H:%M"),
-        )
 
-    console.print(table)
+def _print_alerts_summary_plain(alerts: list[Alert]) -> None:
+    """Write the alert summary as tab-separated lines."""
+    if not alerts:
+        console.file.write("No suspicious activity detected.\n")
+        return
 
+    lines = ["Suspicious Activity Summary", "Severity\tType\tMarket\tDetails\tTime"]
+    lines.extend(
+        "\t".join((severity.value, *cells)) for severity, *cells in _summary_rows(alerts)
+    )
+    console.file.write("\n".join(lines) + "\n")
 
-def print_market(market: Market) -> None:
-    """Print market info."""
+
+def _utcnow() -> datetime:
+    """Current time as naive UTC, matching the datetimes in our models."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _market_detail_lines(market: Market) -> list[str]:
+    """Indented info lines shown under a market's question."""
     time_remaining = None
     if market.end_date:
-        time_remaining = market.end_date - datetime.utcnow()
+        time_remaining = market.end_date - _utcnow()
 
-    console.print(f"[bold]{market.question}[/]")
-    console.print(f"  Slug: {market.slug}")
-    console.print(f"  Volume: {format_usd(market.volume)} (24h: {format_usd(market.volume_24h)})")
-    console.print(f"  Liquidity: {format_usd(market.liquidity)}")
+    lines = [
+        f"  Slug: {market.slug}",
+        f"  Volume: {format_usd(market.volume)} (24h: {format_usd(market.volume_24h)})",
+        f"  Liquidity: {format_usd(market.liquidity)}",
+    ]
 
     if market.outcomes and market.outcome_prices:
         prices = ", ".join(
             f"{o}: {p:.1%}" for o, p in zip(market.outcomes, market.outcome_prices)
         )
-        console.print(f"  Prices: {prices}")
+        lines.append(f"  Prices: {prices}")
 
     if time_remaining:
-        console.print(f"  Closes in: {format_time_delta(time_remaining)}")
+        lines.append(f"  Closes in: {format_time_delta(time_remaining)}")
+    return lines
+
+
+def _print_market_rich(market: Market) -> None:
+    """Print market info."""
+    # Each line is still parsed as its own markup, but rendered in one pass
+    console.print(
+        f"[bold]{market.question}[/]", *_market_detail_lines(market), "", sep="\n"
+    )
+
+
+def _print_market_plain(market: Market) -> None:
+    """Write market info as plain text lines."""
+    lines = [market.question, *_market_detail_lines(market)]
+    console.file.write("\n".join(lines) + "\n\n")
 
-    console.print()
 
+def _market_rows(markets: list[Market]):
+    """Yield (#, market, 24h volume, liquidity, closes in) cells for the table."""
+    # One clock read for the whole table
+    now = _utcnow()
+    for i, market in enumerate(islice(markets, 30), 1):
+        time_remaining = market.end_date - now if market.end_date else None
 
-def print_markets_table(markets: list[Market]) -> None:
+        yield (
+            str(i),
+            _truncate(market.question, 50),
+            format_usd(market.volume_24h),
+            format_usd(market.liquidity),
+            format_time_delta(time_remaining),
+        )
+
+
+def _print_markets_table_rich(markets: list[Market]) -> None:
     """Print table of markets."""
     table = Table(title="High Volume Markets")
     table.add_column("#", style="dim")
@@ -201,17 +336,28 @@ def print_markets_table(markets: list[Market]) -> None:
     table.add_column("Liquidity", justify="right")
     table.add_column("Closes In", justify="right")
 
-    for i, market in enumerate(markets[:30], 1):
-        time_remaining = None
-        if market.end_date:
-            time_remaining = market.end_date - datetime.utcnow()
-
-        table.add_row(
-            str(i),
-            market.question[:50] + ("..." if len(market.question) > 50 else ""),
-            format_usd(market.volume_24h),
-            format_usd(market.liquidity),
-            format_time_delta(time_remaining),
-        )
+    add_row = table.add_row
+    for cells in _market_rows(markets):
+        add_row(*cells)
 
     console.print(table)
+
+
+def _print_markets_table_plain(markets: list[Market]) -> None:
+    """Write the markets table as tab-separated lines."""
+    lines = ["High Volume Markets", "#\tMarket\t24h Volume\tLiquidity\tCloses In"]
+    lines.extend("\t".join(cells) for cells in _market_rows(markets))
+    console.file.write("\n".join(lines) + "\n")
+
+
+# Panels and tables only pay off on a terminal; when output is piped to a
+# file or log, write the same fields as plain lines and skip Rich's render
+# pipeline entirely.
+_USE_RICH = console.is_terminal
+
+print_alert = _print_alert_rich if _USE_RICH else _print_alert_plain
+print_alerts_summary = (
+    _print_alerts_summary_rich if _USE_RICH else _print_alerts_summary_plain
+)
+print_market = _print_market_rich if _USE_RICH else _print_market_plain
+print_markets_table = _print_markets_table_rich if _USE_RICH else _print_markets_table_plain